@@ -0,0 +1,3 @@
+"""
+HTTP helpers shared by the API conftest and test classes.
+"""
@@ -0,0 +1,88 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from apiclient.http_client import ApiClient
+
+CONCURRENCY = 8
+
+
+class AsyncApiClient:
+    """
+    asyncio front end to ApiClient, for fanning out many requests at once.
+
+    Requests run on a thread pool of `concurrency` threads over one shared
+    ApiClient (same timeouts, retries and keep-alive pool sized to match),
+    and a semaphore bounds how many are in flight. on_timing is called on
+    the event loop thread after each request, so reporting (e.g. Allure
+    attachments) stays per request and in order of completion.
+
+    Tests without an event loop use run() to execute coroutines
+    concurrently:
+
+        responses = client.run(*(client.post(path, json=book) for book in books))
+    """
+
+    def __init__(self, base_url, concurrency=CONCURRENCY, headers=None, on_timing=None, **client_options):
+        self.base_url = base_url.rstrip("/")
+        self.on_timing = on_timing
+        self._client = ApiClient(base_url, pool_size=concurrency, **client_options)
+        if headers:
+            self._client.headers.update(headers)
+        self._concurrency = concurrency
+        self._semaphore = None
+        self._loop = asyncio.new_event_loop()
+        self._run_lock = threading.Lock()
+        self._loop.set_default_executor(
+            ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="api-client")
+        )
+
+    @property
+    def session(self):
+        """The ApiClient the requests run on (e.g. to mount adapters)"""
+        return self._client
+
+    @property
+    def headers(self):
+        """Headers sent with every request (e.g. Authorization)"""
+        return self._client.headers
+
+    async def request(self, method, url, **kwargs):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+        async with self._semaphore:
+            response = await asyncio.get_running_loop().run_in_executor(
+                None, lambda: self._client.request(method, url, **kwargs)
+            )
+        if self.on_timing:
+            self.on_timing(response.timings)
+        return response
+
+    async def get(self, url, **kwargs):
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url, **kwargs):
+        return await self.request("PUT", url, **kwargs)
+
+    async def delete(self, url, **kwargs):
+        return await self.request("DELETE", url, **kwargs)
+
+    def run(self, *coroutines, return_exceptions=False):
+        """
+        Run the coroutines concurrently and return their results in order.
+        Calls from several threads take turns on the event loop, which runs
+        on the calling thread so Allure attributes the reports to the test.
+        """
+        async def gather():
+            return await asyncio.gather(*coroutines, return_exceptions=return_exceptions)
+        with self._run_lock:
+            return self._loop.run_until_complete(gather())
+
+    def close(self):
+        with self._run_lock:
+            self._loop.run_until_complete(self._loop.shutdown_default_executor())
+            self._loop.close()
+        self._client.close()
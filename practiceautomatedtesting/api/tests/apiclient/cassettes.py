@@ -0,0 +1,207 @@
+import base64
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from filelock import FileLock
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from apiclient.sweeper import RUN_TAG
+
+OFF = "off"
+RECORD = "record"  # always call the server, (re-)record every response
+REPLAY = "replay"  # replay recordings, call the server and record what is missing
+STRICT = "strict"  # replay recordings only, fail on anything not recorded
+MODES = (OFF, RECORD, REPLAY, STRICT)
+KEPT_HEADERS = ("Content-Type",)
+SESSION_SCOPE = "session"  # recordings made outside of any test
+LOCK_TIMEOUT = 60
+RUN_TAG_IN_BODY = re.compile(r"\s*" + RUN_TAG.pattern)  # differs on every run, so never part of a key
+SECRET_FIELDS = ("token", "access_token", "refresh_token")  # never written to a cassette
+REDACTED = "redacted"
+
+
+class CassetteMiss(requests.RequestException):
+    """A request without a recording, in strict mode"""
+
+
+def _normalized_body(body):
+    if not body:
+        return ""
+    if isinstance(body, str):
+        body = body.encode()
+    try:
+        normalized = json.dumps(json.loads(body), sort_keys=True, separators=(",", ":"))
+        return RUN_TAG_IN_BODY.sub("", normalized)
+    except ValueError:
+        return hashlib.sha1(body).hexdigest()
+
+
+def request_key(request):
+    """
+    Method, path, query (sorted, so parameter order does not matter) and a
+    digest of the body (JSON compared by content, not formatting, and
+    without the run tag of test books). Host and headers are left out, so
+    recordings replay against any base URL, with any token and in any run.
+    """
+    url = urlsplit(request.url)
+    query = "&".join(f"{k}={v}" for k, v in sorted(parse_qsl(url.query, keep_blank_values=True)))
+    body = _normalized_body(request.body)
+    digest = hashlib.sha1(body.encode()).hexdigest()[:16] if body else ""
+    return f"{request.method} {url.path}?{query} {digest}".rstrip()
+
+
+def _redact(value):
+    if isinstance(value, dict):
+        return {key: REDACTED if key in SECRET_FIELDS and item else _redact(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_redact(item) for item in value]
+    return value
+
+
+def redacted_text(text):
+    """A JSON body with its tokens replaced by REDACTED; anything else unchanged"""
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return text
+    redacted = _redact(data)
+    return text if redacted == data else json.dumps(redacted)
+
+
+def _recorded(response):
+    content = response.content
+    try:
+        body = {"text": redacted_text(content.decode("utf-8"))}
+    except UnicodeDecodeError:
+        body = {"base64": base64.b64encode(content).decode()}
+    return {
+        "status": response.status_code,
+        "reason": response.reason,
+        "headers": {name: response.headers[name] for name in KEPT_HEADERS if name in response.headers},
+        **body,
+    }
+
+
+class Cassette:
+    """
+    Recorded responses, loaded into dicts keyed by test and request_key().
+
+    Every test replays its own recordings, so tests replay the same way in
+    any order and on any xdist worker. A key can hold several responses
+    (e.g. listing books before and after creating one); they are replayed
+    in recording order and the last one repeats. A request the current
+    test never recorded itself (e.g. a shared auth call another test
+    happened to make first) falls back to the latest recording of that
+    request from any test. On disk the cassette is a single gzipped JSON
+    file, readable by the current user only. Tokens in response bodies
+    (SECRET_FIELDS) are replaced by REDACTED before they are recorded.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.scope = SESSION_SCOPE
+        self.interactions = self._load()
+        self._fallback = {}
+        for recordings in self.interactions.values():
+            for key, responses in recordings.items():
+                self._fallback[key] = responses[-1]
+        self._recorded = {}
+        self._played = {}
+        self._lock = threading.Lock()
+
+    def _load(self):
+        try:
+            with gzip.open(self.path, "rt") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def play(self, key):
+        with self._lock:
+            responses = self.interactions.get(self.scope, {}).get(key)
+            if not responses:
+                return self._fallback.get(key)
+            index = self._played.get((self.scope, key), 0)
+            self._played[(self.scope, key)] = index + 1
+            return responses[min(index, len(responses) - 1)]
+
+    def record(self, key, response):
+        entry = _recorded(response)
+        with self._lock:
+            self._recorded.setdefault(self.scope, {}).setdefault(key, []).append(entry)
+
+    def save(self):
+        """Merge this process's recordings into the file; other xdist workers may be doing the same"""
+        if not self._recorded:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with FileLock(f"{self.path}.lock", timeout=LOCK_TIMEOUT):
+            interactions = self._load()
+            # New recordings of a request replace the old ones; the test's other requests stay
+            for scope, recordings in self._recorded.items():
+                interactions.setdefault(scope, {}).update(recordings)
+            tmp_file = f"{self.path}.{os.getpid()}.tmp"
+            with open(os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as raw, \
+                    gzip.open(raw, "wt") as f:
+                json.dump(interactions, f, separators=(",", ":"), sort_keys=True)
+            os.replace(tmp_file, self.path)
+        self._recorded = {}
+
+
+class CassetteAdapter(BaseAdapter):
+    """Transport adapter that replays from a cassette and records through the live adapter"""
+
+    def __init__(self, cassette, mode, live):
+        super().__init__()
+        self.cassette = cassette
+        self.mode = mode
+        self.live = live
+
+    def send(self, request, **kwargs):
+        key = request_key(request)
+        if self.mode != RECORD:
+            recorded = self.cassette.play(key)
+            if recorded is not None:
+                return self._replay(request, recorded)
+            if self.mode == STRICT:
+                raise CassetteMiss(f"No recording for {key} in {self.cassette.path}", request=request)
+        response = self.live.send(request, **kwargs)
+        self.cassette.record(key, response)
+        return response
+
+    def _replay(self, request, recorded):
+        response = requests.Response()
+        response.status_code = recorded["status"]
+        response.reason = recorded["reason"]
+        response.headers = CaseInsensitiveDict(recorded["headers"])
+        if "base64" in recorded:
+            response._content = base64.b64decode(recorded["base64"])
+        else:
+            response._content = recorded["text"].encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        self.live.close()
+
+
+def use_cassette(session, cassette, mode):
+    """Route a session's requests through the cassette (no-op when mode is off)"""
+    if mode == OFF:
+        return
+    if mode not in MODES:
+        raise ValueError(f"Unknown cassette mode {mode!r}, expected one of {', '.join(MODES)}")
+    for prefix in ("http://", "https://"):
+        session.mount(prefix, CassetteAdapter(cassette, mode, session.get_adapter(prefix)))
@@ -0,0 +1,75 @@
+import copy
+import threading
+
+SPARES = 2
+
+
+class BookPool:
+    """
+    Books created once per session (per xdist worker) and shared by tests.
+
+    seed() creates one shared book per template plus a few spare copies,
+    all in one concurrent batch. Tests that only read or search lease() a
+    shared book; tests that update or delete take a writable() copy of
+    their own, from the spares while they last. Everything the pool
+    created - plus anything handed to track() - is deleted in one
+    concurrent batch by cleanup() at the end of the session. Books that
+    are already gone (a test deleted its copy) are fine.
+    """
+
+    def __init__(self, client, path, spares=SPARES):
+        self.client = client
+        self.path = path
+        self.spares = spares
+        self._templates = []
+        self._shared = []
+        self._spare_books = []
+        self._created_ids = []
+        self._lock = threading.RLock()
+
+    def _create_all(self, templates):
+        responses = self.client.run(*(self.client.post(self.path, json=book) for book in templates))
+        books = [response.json() for response in responses if response.ok]
+        self.track(book["id"] for book in books)
+        failed = [response.status_code for response in responses if not response.ok]
+        if failed:
+            raise RuntimeError(f"Could not create {len(failed)} pool books (status {failed[0]})")
+        return books
+
+    def seed(self, templates):
+        """Create the shared books and the spares; later calls are no-ops"""
+        with self._lock:
+            if self._templates:
+                return
+            templates = [copy.deepcopy(book) for book in templates]
+            spares = [templates[i % len(templates)] for i in range(self.spares)]
+            books = self._create_all(templates + spares)
+            # Only a complete seed counts, so a test after a failed one seeds again
+            self._templates = templates
+            self._shared = books[:len(templates)]
+            self._spare_books = books[len(templates):]
+
+    def lease(self, index=0):
+        """A shared book created from templates[index]; read it, do not change it"""
+        return copy.deepcopy(self._shared[index])
+
+    def writable(self):
+        """A book of the test's own (a copy of one of the templates) to update or delete"""
+        with self._lock:
+            if self._spare_books:
+                return self._spare_books.pop()
+        return self._create_all(self._templates[:1])[0]
+
+    def track(self, book_ids):
+        """Delete these books with the pool's at the end of the session"""
+        with self._lock:
+            self._created_ids.extend(book_ids)
+
+    def cleanup(self):
+        """Delete every created book in one concurrent batch, ignoring failures"""
+        with self._lock:
+            book_ids, self._created_ids = self._created_ids, []
+        self.client.run(
+            *(self.client.delete(f"{self.path}/{book_id}") for book_id in book_ids),
+            return_exceptions=True
+        )
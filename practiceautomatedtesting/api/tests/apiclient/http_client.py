@@ -0,0 +1,167 @@
+import socket
+import threading
+from time import perf_counter
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError
+from urllib3.util.connection import allowed_gai_family
+from urllib3.util.retry import Retry
+
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 10
+RETRIES = 2
+BACKOFF = 0.3
+RETRY_STATUSES = (502, 503, 504)
+
+# Timings of the request running on this thread, filled in by the connection
+_local = threading.local()
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 1)
+
+
+def _timings():
+    return getattr(_local, "timings", None)
+
+
+class TimedConnectionMixin:
+    """
+    Records DNS, TCP connect, TLS handshake and time to first byte of a
+    urllib3 connection into the timings of the current request
+    """
+
+    def _new_conn(self):
+        timings = _timings()
+        host = self._dns_host
+        start = perf_counter()
+        try:
+            addresses = socket.getaddrinfo(host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+        except socket.gaierror:
+            # Let urllib3 raise (and retry) its own resolution error
+            return super()._new_conn()
+        resolved = perf_counter()
+
+        # Connect to the addresses we just resolved, so DNS is not timed twice
+        error = None
+        try:
+            for *_, address in addresses:
+                self._dns_host = address[0]
+                try:
+                    return super()._new_conn()
+                except ConnectTimeoutError as e:
+                    error = e
+            raise error
+        finally:
+            self._dns_host = host
+            if timings is not None:
+                timings["dns_ms"] = _ms(resolved - start)
+                timings["connect_ms"] = _ms(perf_counter() - resolved)
+
+    def connect(self):
+        timings = _timings()
+        start = perf_counter()
+        super().connect()
+        if timings is not None:
+            timings["reused"] = False
+            # Whatever connect() spent beyond DNS and TCP is the TLS handshake (and proxy tunnel)
+            handshake = _ms(perf_counter() - start) - timings.get("dns_ms", 0) - timings.get("connect_ms", 0)
+            timings["tls_ms"] = round(max(handshake, 0), 1)
+
+    def getresponse(self, *args, **kwargs):
+        start = perf_counter()
+        response = super().getresponse(*args, **kwargs)
+        timings = _timings()
+        if timings is not None:
+            timings["ttfb_ms"] = _ms(perf_counter() - start)
+        return response
+
+
+class TimedHTTPConnection(TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools use the timed connections"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+
+
+class ApiClient(requests.Session):
+    """
+    requests.Session for the API tests.
+
+    - Every request gets a (connect, read) timeout unless it passes its own,
+      so a hung server fails the test instead of stalling the worker.
+    - Idempotent methods (GET, HEAD, PUT, DELETE, OPTIONS) are retried with
+      exponential backoff on read errors and 502/503/504. POST is only
+      retried when the connection could not be made, i.e. when it was never
+      sent.
+    - The connection pool holds pool_size keep-alive connections. Tests run
+      one at a time per xdist worker, so one is enough there; callers that
+      share the client between threads pass their thread count.
+    - Every response carries its DNS, connect, TLS, time to first byte and
+      total time in milliseconds as response.timings (zero for
+      DNS/connect/TLS on a reused connection). They are also kept in
+      last_timings and passed to on_timing.
+
+    Paths starting with "/" are resolved against base_url.
+    """
+
+    def __init__(self, base_url, connect_timeout=CONNECT_TIMEOUT, read_timeout=READ_TIMEOUT,
+                 retries=RETRIES, backoff=BACKOFF, pool_size=1, on_timing=None):
+        super().__init__()
+        self.base_url = base_url.rstrip("/")
+        self.timeout = (connect_timeout, read_timeout)
+        self.on_timing = on_timing
+        self.last_timings = None
+
+        retry = Retry(
+            total=retries, connect=retries, read=retries, status=retries,
+            backoff_factor=backoff, status_forcelist=RETRY_STATUSES,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS, raise_on_status=False
+        )
+        adapter = TimedAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+
+    def request(self, method, url, *args, **kwargs):
+        if url.startswith("/"):
+            url = self.base_url + url
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+
+        timings = {"dns_ms": 0.0, "connect_ms": 0.0, "tls_ms": 0.0, "ttfb_ms": 0.0, "reused": True}
+        _local.timings = timings
+        start = perf_counter()
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        finally:
+            _local.timings = None
+        timings["total_ms"] = _ms(perf_counter() - start)
+
+        response.timings = {"method": method.upper(), "url": url, "status": response.status_code, **timings}
+        self.last_timings = response.timings
+        if self.on_timing:
+            self.on_timing(self.last_timings)
+        return response
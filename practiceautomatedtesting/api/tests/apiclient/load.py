@@ -0,0 +1,213 @@
+import itertools
+import math
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+SUB_BUCKET_BITS = 7  # 128 sub-buckets per power of two: under 1% error
+ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F-]{16,})$")
+
+
+class LatencyHistogram:
+    """
+    Latency histogram in the style of HdrHistogram.
+
+    Values (microseconds) are counted in log-linear buckets: every power of
+    two is split into 2**SUB_BUCKET_BITS linear sub-buckets, so any
+    percentile is accurate to under 1% while memory stays bounded however
+    many values are recorded.
+    """
+
+    def __init__(self):
+        self.counts = {}
+        self.total = 0
+        self.max = 0
+        self.sum = 0
+
+    def record(self, value_us):
+        value = max(int(value_us), 1)
+        shift = max(value.bit_length() - SUB_BUCKET_BITS, 0)
+        bucket = (shift, value >> shift)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.total += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    @staticmethod
+    def _upper(bucket):
+        shift, sub_bucket = bucket
+        return ((sub_bucket + 1) << shift) - 1
+
+    def _buckets(self):
+        return sorted(self.counts.items(), key=lambda item: self._upper(item[0]))
+
+    def percentile(self, percent):
+        """Smallest recorded value (bucket upper bound) that percent% of the values do not exceed"""
+        if not self.total:
+            return 0
+        target = max(math.ceil(self.total * percent / 100), 1)
+        seen = 0
+        for bucket, count in self._buckets():
+            seen += count
+            if seen >= target:
+                return min(self._upper(bucket), self.max)
+        return self.max
+
+    @property
+    def mean(self):
+        return self.sum / self.total if self.total else 0
+
+    def distribution(self, ticks_per_half=5):
+        """
+        Percentile distribution in HdrHistogram's text format (milliseconds),
+        with finer steps towards the tail: 0, 50, 75, 87.5, ... 100
+        """
+        lines = [f"{'Value(ms)':>12} {'Percentile':>14} {'TotalCount':>11} {'1/(1-Percentile)':>17}", ""]
+        percents = [0.0]
+        remaining = 100.0
+        while remaining > 100 / max(self.total, 1) and len(percents) < 200:
+            step = remaining / 2 / ticks_per_half
+            for _ in range(ticks_per_half):
+                percents.append(percents[-1] + step)
+            remaining /= 2
+        percents.append(100.0)
+        for percent in percents:
+            value = self.percentile(percent)
+            count = max(math.ceil(self.total * percent / 100), 1)
+            inverse = f"{1 / (1 - percent / 100):17.2f}" if percent < 100 else f"{'inf':>17}"
+            lines.append(f"{value / 1000:12.3f} {percent / 100:14.12f} {count:11d} {inverse}")
+        lines += ["", f"#[Mean = {self.mean / 1000:.3f}, Max = {self.max / 1000:.3f}, Total count = {self.total}]"]
+        return "\n".join(lines)
+
+
+def endpoint_name(method, url):
+    """'GET /v1/practice/books/{id}' for 'GET https://host/v1/practice/books/42?x=1'"""
+    segments = ["{id}" if ID_SEGMENT.match(segment) else segment for segment in urlsplit(url).path.split("/")]
+    return f"{method} {'/'.join(segments)}"
+
+
+class LoadStats:
+    """Per-endpoint latency, request and error counts, plus per-scenario outcomes; thread-safe"""
+
+    def __init__(self):
+        self.endpoints = {}
+        self.scenarios = {}
+        self._lock = threading.Lock()
+
+    def record_request(self, timings):
+        """ApiClient on_timing callback"""
+        name = endpoint_name(timings["method"], timings["url"])
+        with self._lock:
+            endpoint = self.endpoints.setdefault(name, {"histogram": LatencyHistogram(), "errors": 0})
+            endpoint["histogram"].record(timings["total_ms"] * 1000)
+            if timings["status"] >= 400:
+                endpoint["errors"] += 1
+
+    def record_scenario(self, name, outcome):
+        """outcome: passed, failed (a functional check failed) or error (anything else)"""
+        with self._lock:
+            scenario = self.scenarios.setdefault(name, {"passed": 0, "failed": 0, "error": 0})
+            scenario[outcome] += 1
+
+    @property
+    def requests(self):
+        return sum(endpoint["histogram"].total for endpoint in self.endpoints.values())
+
+    @property
+    def request_errors(self):
+        return sum(endpoint["errors"] for endpoint in self.endpoints.values())
+
+    @property
+    def scenario_runs(self):
+        return sum(sum(scenario.values()) for scenario in self.scenarios.values())
+
+    @property
+    def scenario_failures(self):
+        """Scenario runs that did not pass: a functional check failed or anything else went wrong"""
+        return sum(scenario["failed"] + scenario["error"] for scenario in self.scenarios.values())
+
+    def summary(self, elapsed):
+        """Throughput, error rate and latency percentiles per endpoint, as a text table"""
+        lines = [
+            f"{'Endpoint':<36} {'Requests':>9} {'Req/s':>9} {'Errors':>8} "
+            f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'Max ms':>9}"
+        ]
+        for name, endpoint in sorted(self.endpoints.items()):
+            histogram = endpoint["histogram"]
+            lines.append(
+                f"{name:<36} {histogram.total:>9} {histogram.total / elapsed:>9.1f} "
+                f"{endpoint['errors'] / histogram.total:>8.2%} "
+                + " ".join(f"{histogram.percentile(p) / 1000:>9.2f}" for p in (50, 95, 99))
+                + f" {histogram.max / 1000:>9.2f}"
+            )
+        total = self.requests
+        lines.append(
+            f"{'Total':<36} {total:>9} {total / elapsed:>9.1f} "
+            f"{(self.request_errors / total if total else 0):>8.2%}"
+        )
+        lines += ["", f"{'Scenario':<36} {'Passed':>9} {'Failed':>9} {'Errors':>8}"]
+        for name, scenario in sorted(self.scenarios.items()):
+            lines.append(f"{name:<36} {scenario['passed']:>9} {scenario['failed']:>9} {scenario['error']:>8}")
+        return "\n".join(lines)
+
+
+def _run_once(stats, name, scenario):
+    try:
+        scenario()
+    except AssertionError:
+        stats.record_scenario(name, "failed")
+    except Exception:
+        stats.record_scenario(name, "error")
+    else:
+        stats.record_scenario(name, "passed")
+
+
+def run_load(scenarios, stats, duration, users=8, rate=None):
+    """
+    Run the scenarios ({name: callable}) round-robin for `duration` seconds
+    and return the elapsed time.
+
+    Without a rate this is a closed model: `users` threads each run one
+    scenario after another. With a rate (scenarios per second) it is an
+    open model: scenarios start on a fixed schedule whether or not earlier
+    ones have finished, with at most `users` running at once; starts that
+    find every user busy wait for one, which shows up as lower throughput.
+    """
+    names = sorted(scenarios)
+    deadline = time.monotonic() + duration
+    start = time.monotonic()
+
+    if rate is None:
+        def user(offset):
+            for i in itertools.count(offset):
+                if time.monotonic() >= deadline:
+                    return
+                name = names[i % len(names)]
+                _run_once(stats, name, scenarios[name])
+
+        threads = [threading.Thread(target=user, args=(i,), name=f"load-user-{i}") for i in range(users)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return time.monotonic() - start
+
+    slots = threading.BoundedSemaphore(users)
+    with ThreadPoolExecutor(max_workers=users, thread_name_prefix="load-user") as executor:
+        for i in itertools.count():
+            next_start = start + i / rate
+            if next_start >= deadline:
+                break
+            time.sleep(max(next_start - time.monotonic(), 0))
+            slots.acquire()
+            name = names[i % len(names)]
+
+            def task(name=name):
+                try:
+                    _run_once(stats, name, scenarios[name])
+                finally:
+                    slots.release()
+            executor.submit(task)
+    return time.monotonic() - start
@@ -0,0 +1,262 @@
+"""
+Offline stand-in for the practice Book and Auth APIs.
+
+Implements /practice/auth and /v1/practice/books (list with q, category,
+min_price/max_price, sort/order and skip/limit; create, get, update,
+delete) in memory on a threaded HTTP/1.1 server with keep-alive. Starts in
+milliseconds, so the API suite can run without the network:
+
+    API_BASE_URL=stub pytest
+
+or standalone, for poking at it or pointing other tools at it:
+
+    python -m apiclient.stub_server --port 8000
+"""
+import argparse
+import copy
+import json
+import secrets
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+STUB = "stub"  # API_BASE_URL value that selects the stub server
+AUTH_PATH = "/practice/auth"
+BOOKS_PATH = "/v1/practice/books"
+USERS = {"admin": "password123"}
+REQUIRED_FIELDS = ("title", "author", "price")
+RESPONSE_HEAD = b"HTTP/1.1 %d %s\r\nServer: BookApiStub/1.0\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n"
+POLL_INTERVAL = 0.05  # how quickly stop() returns
+
+SEED_BOOKS = [
+    {"title": "Clean Code", "author": "Robert C. Martin", "price": 32.99,
+     "description": "A handbook of agile software craftsmanship.", "category": "Development",
+     "isbn": "9780132350884", "stock": 12},
+    {"title": "Lessons Learned in Software Testing", "author": "Cem Kaner", "price": 18.50,
+     "description": "A context-driven approach.", "category": "Testing", "isbn": "9780471081128", "stock": 4},
+    {"title": "Python Testing with pytest", "author": "Brian Okken", "price": 15.99,
+     "description": "Simple, rapid, effective and scalable.", "category": "Testing",
+     "isbn": "9781680508604", "stock": 25},
+    {"title": "The Pragmatic Programmer", "author": "David Thomas", "price": 41.00,
+     "description": "Your journey to mastery.", "category": "Development", "isbn": "9780135957059", "stock": 7},
+    {"title": "Explore It!", "author": "Elisabeth Hendrickson", "price": 9.99,
+     "description": "Reduce risk and increase confidence with exploratory testing.", "category": "Testing",
+     "isbn": "9781937785024", "stock": 3},
+]
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class BookStore:
+    """Thread-safe in-memory book collection"""
+
+    def __init__(self, seed=SEED_BOOKS):
+        self._lock = threading.Lock()
+        self._books = {}
+        self._next_id = 1
+        for book in seed:
+            self.create(book)
+
+    def _validate(self, data):
+        if not isinstance(data, dict):
+            raise ApiError(400, "Invalid request body")
+        missing = [field for field in REQUIRED_FIELDS if field not in data]
+        if missing:
+            raise ApiError(400, f"Missing required fields: {', '.join(missing)}")
+        if not isinstance(data["price"], (int, float)) or data["price"] < 0:
+            raise ApiError(400, "Invalid price")
+
+    def list(self, query):
+        def number(name):
+            try:
+                return float(query[name]) if name in query else None
+            except ValueError:
+                raise ApiError(400, f"Invalid {name}")
+
+        def integer(name, default):
+            try:
+                return max(int(query.get(name, default)), 0)
+            except ValueError:
+                raise ApiError(400, f"Invalid {name}")
+
+        min_price, max_price = number("min_price"), number("max_price")
+        skip, limit = integer("skip", 0), integer("limit", 0)
+        search = query.get("q", "").lower()
+        category = query.get("category")
+
+        with self._lock:
+            books = list(self._books.values())
+        if search:
+            books = [b for b in books if any(search in str(b.get(field, "")).lower()
+                                             for field in ("title", "author", "description"))]
+        if category:
+            books = [b for b in books if b.get("category") == category]
+        if min_price is not None:
+            books = [b for b in books if b["price"] >= min_price]
+        if max_price is not None:
+            books = [b for b in books if b["price"] <= max_price]
+
+        sort_field = query.get("sort")
+        if sort_field:
+            try:
+                books.sort(key=lambda b: (b.get(sort_field) is None, b.get(sort_field)),
+                           reverse=query.get("order", "asc").lower() == "desc")
+            except TypeError:
+                # e.g. a field that holds numbers in some books and strings in others
+                raise ApiError(400, f"Cannot sort by {sort_field}")
+        books = books[skip:]
+        return books[:limit] if limit else books
+
+    def get(self, book_id):
+        with self._lock:
+            book = self._books.get(book_id)
+        if book is None:
+            raise ApiError(404, "Book not found")
+        return book
+
+    def create(self, data):
+        self._validate(data)
+        with self._lock:
+            book = {**copy.deepcopy(data), "id": self._next_id}
+            self._books[self._next_id] = book
+            self._next_id += 1
+        return book
+
+    def update(self, book_id, data):
+        self._validate(data)
+        with self._lock:
+            if book_id not in self._books:
+                raise ApiError(404, "Book not found")
+            book = self._books[book_id] = {**copy.deepcopy(data), "id": book_id}
+        return book
+
+    def delete(self, book_id):
+        with self._lock:
+            if self._books.pop(book_id, None) is None:
+                raise ApiError(404, "Book not found")
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+    disable_nagle_algorithm = True  # small responses go out immediately
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, payload):
+        # Status line, headers and body in one write: about twice the
+        # throughput of send_response()/send_header()/end_headers()
+        body = json.dumps(payload).encode()
+        head = RESPONSE_HEAD % (status, HTTPStatus(status).phrase.encode(), len(body))
+        self.wfile.write(head + body)
+
+    def _body(self):
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            # The body cannot be skipped without a length, so the connection cannot be reused
+            self.close_connection = True
+            raise ApiError(400, "Invalid Content-Length")
+        raw = self.rfile.read(length) if length else b""
+        try:
+            return json.loads(raw) if raw else None
+        except ValueError:
+            raise ApiError(400, "Invalid JSON body")
+
+    def _book_id(self, path):
+        try:
+            return int(path[len(BOOKS_PATH) + 1:])
+        except ValueError:
+            raise ApiError(404, "Book not found")
+
+    def _dispatch(self):
+        url = urlsplit(self.path)
+        path = url.path.rstrip("/")
+        store = self.server.store
+        try:
+            if path == AUTH_PATH and self.command == "POST":
+                self._send(200, self._authenticate(self._body()))
+            elif path == BOOKS_PATH and self.command == "GET":
+                query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+                self._send(200, store.list(query))
+            elif path == BOOKS_PATH and self.command == "POST":
+                self._send(201, store.create(self._body()))
+            elif path.startswith(BOOKS_PATH + "/") and self.command == "GET":
+                self._send(200, store.get(self._book_id(path)))
+            elif path.startswith(BOOKS_PATH + "/") and self.command == "PUT":
+                self._send(200, store.update(self._book_id(path), self._body()))
+            elif path.startswith(BOOKS_PATH + "/") and self.command == "DELETE":
+                store.delete(self._book_id(path))
+                self._send(200, {"message": "Book deleted successfully"})
+            else:
+                self._send(404, {"error": "Not found"})
+        except ApiError as e:
+            self._send(e.status, {"error": e.message})
+
+    def _authenticate(self, data):
+        if not isinstance(data, dict) or "username" not in data or "password" not in data:
+            raise ApiError(400, "Invalid request: username and password are required")
+        if USERS.get(data["username"]) != data["password"]:
+            raise ApiError(401, "Invalid credentials")
+        return {"token": secrets.token_urlsafe(24), "user": data["username"]}
+
+    do_GET = do_POST = do_PUT = do_DELETE = _dispatch
+
+
+class StubServer:
+    """The stub API on a background thread; port 0 picks a free port"""
+
+    def __init__(self, host="127.0.0.1", port=0):
+        self._server = ThreadingHTTPServer((host, port), StubHandler)
+        self._server.daemon_threads = True
+        self._server.store = BookStore()
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, args=(POLL_INTERVAL,), name="api-stub", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serve on the calling thread until interrupted"""
+        try:
+            self._server.serve_forever(POLL_INTERVAL)
+        finally:
+            self._server.server_close()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline stub of the practice Book and Auth APIs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args(argv)
+
+    server = StubServer(args.host, args.port)
+    print(f"Serving the API stub on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+import base64
+import json
+import os
+import time
+from urllib.parse import urlsplit
+
+from filelock import FileLock
+from requests.auth import AuthBase
+
+CACHE_DIR = os.getenv(
+    'API_TOKEN_CACHE_DIR',
+    os.path.join(os.path.expanduser("~"), ".cache", "pythonfortesters")
+)
+CACHE_FILE = os.path.join(CACHE_DIR, "api_tokens.json")
+AUTH_PATH = "/practice/auth"
+LOCK_TIMEOUT = 60
+DEFAULT_TTL = 30 * 60  # seconds, when the token does not say when it expires
+EXPIRY_MARGIN = 30  # refresh this many seconds before the token expires
+LOCAL_HOSTS = ("localhost", "127.0.0.1", "::1")  # the stub server, on a new port every run
+
+
+def token_expiry(token, response_data, now, default_ttl=DEFAULT_TTL):
+    """
+    When a token expires (epoch seconds): the `exp` claim of a JWT, else an
+    `expires_in` in the auth response, else now + default_ttl
+    """
+    parts = token.split(".")
+    if len(parts) == 3:
+        try:
+            payload = parts[1] + "=" * (-len(parts[1]) % 4)
+            exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+            if isinstance(exp, (int, float)):
+                return exp
+        except (ValueError, AttributeError):
+            pass
+    expires_in = response_data.get("expires_in")
+    if isinstance(expires_in, (int, float)):
+        return now + expires_in
+    return now + default_ttl
+
+
+def _read_cache():
+    try:
+        with open(CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(entries):
+    """Write the unexpired entries, readable by the current user only"""
+    now = time.time()
+    entries = {key: entry for key, entry in entries.items() if entry.get("expires_at", 0) > now}
+    tmp_file = f"{CACHE_FILE}.{os.getpid()}.tmp"
+    with open(os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as f:
+        json.dump(entries, f, indent=2)
+    os.replace(tmp_file, CACHE_FILE)
+
+
+def is_local(base_url):
+    return urlsplit(base_url).hostname in LOCAL_HOSTS
+
+
+class TokenCache:
+    """
+    Auth tokens shared by every test and every xdist worker.
+
+    The first get() POSTs the credentials and stores the token with its
+    expiry in an on-disk cache (keyed by base URL and user); every later
+    call - from this process or from any other worker, in this run or the
+    next - reuses it until shortly before it expires. A file lock makes
+    sure only one worker authenticates at a time. invalidate() drops a
+    token the server rejected, so the next get() fetches a new one.
+
+    Expired entries are pruned whenever the file is written. Tokens for
+    local servers (the stub, on a new port every run) stay in memory only,
+    as do all tokens with persist=False.
+    """
+
+    def __init__(self, client, username, password, auth_path=AUTH_PATH, default_ttl=DEFAULT_TTL, persist=None):
+        self.client = client
+        self.username = username
+        self.password = password
+        self.auth_path = auth_path
+        self.default_ttl = default_ttl
+        self.key = f"{client.base_url}|{username}"
+        self.persist = not is_local(client.base_url) if persist is None else persist
+        self._entry = None
+
+    def _valid(self, entry):
+        return bool(entry) and entry["expires_at"] - EXPIRY_MARGIN > time.time()
+
+    def get(self):
+        """A valid token, or None if authentication fails"""
+        if self._valid(self._entry):
+            return self._entry["token"]
+        if not self.persist:
+            self._entry = self._authenticate()
+            return self._entry["token"] if self._entry else None
+
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with FileLock(f"{CACHE_FILE}.lock", timeout=LOCK_TIMEOUT):
+            entries = _read_cache()
+            entry = entries.get(self.key)
+            if not self._valid(entry):
+                entry = self._authenticate()
+                if entry is None:
+                    return None
+                entries[self.key] = entry
+                _write_cache(entries)
+        self._entry = entry
+        return entry["token"]
+
+    def _authenticate(self):
+        response = self.client.post(
+            f"{self.client.base_url}{self.auth_path}",
+            json={"username": self.username, "password": self.password}
+        )
+        if not response.ok:
+            return None
+        data = response.json()
+        token = data.get("token")
+        if not token:
+            return None
+        now = time.time()
+        return {"token": token, "expires_at": token_expiry(token, data, now, self.default_ttl), "issued_at": now}
+
+    def invalidate(self, token):
+        """Forget a rejected token, unless another worker already replaced it"""
+        if self._entry and self._entry["token"] == token:
+            self._entry = None
+        if not self.persist:
+            return
+        with FileLock(f"{CACHE_FILE}.lock", timeout=LOCK_TIMEOUT):
+            entries = _read_cache()
+            if entries.get(self.key, {}).get("token") == token:
+                del entries[self.key]
+                _write_cache(entries)
+
+
+class TokenAuth(AuthBase):
+    """
+    requests auth that sends the cached token as a Bearer header and, on a
+    401, refreshes the token and retries the request once
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+
+    def _sign(self, request, token):
+        request.headers["Authorization"] = f"Bearer {token}"
+        return request
+
+    def __call__(self, request):
+        token = self.cache.get()
+        if token:
+            self._sign(request, token)
+        request.register_hook("response", self.handle_401)
+        return request
+
+    def handle_401(self, response, **kwargs):
+        if response.status_code != 401:
+            return response
+        rejected = response.request.headers.get("Authorization", "").removeprefix("Bearer ")
+        if rejected:
+            self.cache.invalidate(rejected)
+        token = self.cache.get()
+        if not token or token == rejected:
+            return response
+
+        # Same approach as requests' HTTPDigestAuth: release the connection, re-send once
+        response.content
+        response.close()
+        retry_request = self._sign(response.request.copy(), token)
+        retry = response.connection.send(retry_request, **kwargs)
+        retry.history.append(response)
+        retry.request = retry_request
+        return retry
@@ -1,30 +1,176 @@
 import pytest
-import requests
+import json
 import os
+import allure
+import requests
 from dotenv import load_dotenv
+from apiclient.http_client import ApiClient, CONNECT_TIMEOUT, READ_TIMEOUT, RETRIES
+from apiclient.async_client import AsyncApiClient, CONCURRENCY
+from apiclient.tokens import TokenAuth, TokenCache, DEFAULT_TTL
+from apiclient.stub_server import StubServer, STUB, BOOKS_PATH
+from apiclient.data_pool import BookPool, SPARES
+from apiclient.cassettes import Cassette, use_cassette, OFF, REPLAY, STRICT, SESSION_SCOPE
+from apiclient.sweeper import sweep, current_run_id, SWEEP_PATTERN, MIN_AGE
+
+CASSETTE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cassettes", "api.json.gz")
 
 # Load environment variables
 load_dotenv()
 
+# The load test only runs when asked for (API_LOAD_DURATION=<seconds>)
+collect_ignore = [] if os.getenv('API_LOAD_DURATION') else ["test_book_load.py"]
+
+def api_base_url():
+    return os.getenv("API_BASE_URL", "https://api.practiceautomatedtesting.com")
+
 @pytest.fixture(scope="session")
 def base_url():
-    """Return the base URL for the API"""
-    return os.getenv("API_BASE_URL", "https://api.practiceautomatedtesting.com")
+    """Return the base URL for the API; API_BASE_URL=stub starts the offline stub server"""
+    url = api_base_url()
+    if url.lower() != STUB:
+        yield url
+        return
+    server = StubServer().start()
+    yield server.url
+    server.stop()
+
+def attach_timings(timings):
+    """Attach the timings of one request to the current Allure step"""
+    allure.attach(
+        json.dumps(timings, indent=2),
+        name=f"{timings['method']} {timings['url']} - {timings['status']} in {timings['total_ms']} ms",
+        attachment_type=allure.attachment_type.JSON
+    )
+
+def client_options():
+    """Timeouts, retries and timing reporting shared by the sync and async clients"""
+    return {
+        "connect_timeout": float(os.getenv('API_CONNECT_TIMEOUT', CONNECT_TIMEOUT)),
+        "read_timeout": float(os.getenv('API_READ_TIMEOUT', READ_TIMEOUT)),
+        "retries": int(os.getenv('API_RETRIES', RETRIES)),
+        "on_timing": attach_timings if os.getenv('API_TIMINGS', 'true').lower() == 'true' else None,
+    }
 
 @pytest.fixture(scope="session")
-def api_client(base_url):
-    """Return a requests session with base URL configured"""
-    session = requests.Session()
-    session.base_url = base_url
-    return session
+def api_client_options():
+    """Timeouts and retries of api_client, for tests that build clients of their own"""
+    return {name: value for name, value in client_options().items() if name != "on_timing"}
 
-@pytest.fixture(scope="function")
-def auth_token(api_client):
-    """Get authentication token"""
-    response = api_client.post(
-        f"{api_client.base_url}/practice/auth",
-        json={"username": "admin", "password": "password123"}
+def cassette_mode():
+    return os.getenv('API_CASSETTE', OFF).lower()
+
+@pytest.fixture(scope="session")
+def cassette():
+    """Recorded responses for API_CASSETTE=record|replay|strict, saved when the session ends"""
+    if cassette_mode() == OFF:
+        yield None
+        return
+    cassette = Cassette(os.getenv('API_CASSETTE_FILE', CASSETTE_FILE))
+    yield cassette
+    cassette.save()
+
+@pytest.fixture(autouse=True)
+def cassette_scope(request, cassette):
+    """Record and replay each test's requests under its own node id"""
+    if cassette is None:
+        yield
+        return
+    cassette.scope = request.node.nodeid
+    yield
+    cassette.scope = SESSION_SCOPE
+
+@pytest.fixture(scope="session")
+def api_client(base_url, cassette):
+    """Return an API client with timeouts, retries and per-request timings configured"""
+    client = ApiClient(base_url, **client_options())
+    use_cassette(client, cassette, cassette_mode())
+    yield client
+    client.close()
+
+@pytest.fixture(scope="session")
+def async_api_client(api_client, cassette):
+    """asyncio client for concurrent requests, with the same base URL and headers as api_client"""
+    client = AsyncApiClient(
+        api_client.base_url,
+        concurrency=int(os.getenv('API_CONCURRENCY', CONCURRENCY)),
+        headers=dict(api_client.headers),
+        **client_options()
+    )
+    use_cassette(client.session, cassette, cassette_mode())
+    yield client
+    client.close()
+
+@pytest.fixture(scope="session")
+def book_pool(async_api_client):
+    """Books shared across tests: seeded on first use, deleted in one batch when the session ends"""
+    pool = BookPool(async_api_client, BOOKS_PATH, spares=int(os.getenv('API_POOL_SPARES', SPARES)))
+    yield pool
+    pool.cleanup()
+
+@pytest.fixture(scope="session")
+def token_cache(api_client):
+    """Auth tokens shared across tests and xdist workers, refreshed when they expire"""
+    return TokenCache(
+        api_client,
+        username=os.getenv('API_USERNAME', 'admin'),
+        password=os.getenv('API_PASSWORD', 'password123'),
+        default_ttl=int(os.getenv('API_TOKEN_TTL', DEFAULT_TTL)),
+        # Replayed tokens are redacted placeholders; never share them with live runs
+        persist=False if cassette_mode() in (REPLAY, STRICT) else None
     )
-    if response.ok:
-        return response.json().get("token")
-    return None 
\ No newline at end of file
+
+@pytest.fixture(scope="function")
+def auth_token(token_cache):
+    """Get authentication token (authenticates once per session, not per test)"""
+    return token_cache.get()
+
+@pytest.fixture(scope="session")
+def token_auth(token_cache):
+    """requests auth for authenticated calls: api_client.get(url, auth=token_auth). Retries once on a 401"""
+    return TokenAuth(token_cache)
+
+def sweep_orphans(config, when):
+    """
+    Delete test books leaked by this run (session end) or by runs that
+    started more than API_SWEEP_MIN_AGE seconds ago (session start and end).
+    Untagged test books only go with API_SWEEP_UNTAGGED=true
+    """
+    url = api_base_url()
+    if (hasattr(config, "workerinput") or config.option.collectonly or url.lower() == STUB
+            or cassette_mode() in (REPLAY, STRICT) or os.getenv('API_SWEEP', 'true').lower() != 'true'):
+        # Workers leave it to the controller, so no worker sweeps books another one is using;
+        # the stub and replayed runs start empty
+        return
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    if when == "end":
+        # The progress line is still open at this point
+        reporter.write("\n")
+    try:
+        removed, failed = sweep(
+            url, BOOKS_PATH,
+            pattern=os.getenv('API_SWEEP_PATTERN', SWEEP_PATTERN),
+            run_id=current_run_id(),
+            min_age=float(os.getenv('API_SWEEP_MIN_AGE', MIN_AGE)),
+            untagged=os.getenv('API_SWEEP_UNTAGGED', 'false').lower() == 'true',
+            concurrency=int(os.getenv('API_CONCURRENCY', CONCURRENCY)),
+            **{**client_options(), "on_timing": None}
+        )
+    except requests.RequestException as e:
+        reporter.write_line(f"Orphan sweep at session {when} skipped: {e}")
+        return
+    if removed or failed:
+        titles = ", ".join(sorted({book.get("title", "?") for book in removed}))
+        reporter.write_line(f"Orphan sweep at session {when}: removed {len(removed)} test books ({titles})")
+    if failed:
+        reporter.write_line(f"Orphan sweep at session {when}: could not remove {len(failed)} books: "
+                            f"{', '.join(str(book.get('id')) for book in failed)}")
+
+def pytest_configure(config):
+    # Books are tagged with the run id; set it before xdist starts the workers, so they inherit it
+    current_run_id()
+
+def pytest_sessionstart(session):
+    sweep_orphans(session.config, "start")
+
+def pytest_sessionfinish(session):
+    sweep_orphans(session.config, "end")
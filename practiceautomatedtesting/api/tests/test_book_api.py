@@ -1,11 +1,12 @@
 import pytest
 import requests
 import allure
+from apiclient.sweeper import run_tagged
 
 BASE_PATH = "/v1/practice/books"
 
-# Example books for testing
-EXAMPLE_BOOKS = [
+# Example books for testing, tagged with the run id so the orphan sweeper can tell whose they are
+EXAMPLE_BOOKS = run_tagged([
     {
         "title": "Python Test Book 1",
         "author": "Test Author 1",
@@ -24,23 +25,22 @@ EXAMPLE_BOOKS = [
         "isbn": "0987654321",
         "stock": 15
     }
-]
+])
 
 @allure.epic("Book API")
 @allure.feature("Book Management")
 class TestBookAPI:
     @pytest.fixture(autouse=True)
-    def setup(self, api_client):
+    def setup(self, api_client, book_pool):
         """Setup and cleanup for each test"""
         self.client = api_client
+        self.pool = book_pool
+        # The example books are created once per session and shared
+        self.pool.seed(EXAMPLE_BOOKS)
         self.created_book_ids = []
         yield
-        # Cleanup: Delete all created books
-        for book_id in self.created_book_ids:
-            try:
-                self.client.delete(f"{self.client.base_url}{BASE_PATH}/{book_id}")
-            except:
-                pass
+        # Cleanup: books created by the test are deleted with the pool at the end of the session
+        self.pool.track(self.created_book_ids)
 
     @allure.story("Get Books")
     @allure.severity(allure.severity_level.NORMAL)
@@ -58,14 +58,8 @@ class TestBookAPI:
     @allure.title("Test GET all books - With Search Query")
     def test_get_all_books_with_search(self):
         """Test GET all books - With Search Query"""
-        with allure.step("Create a book with specific title"):
-            create_response = self.client.post(
-                f"{self.client.base_url}{BASE_PATH}",
-                json=EXAMPLE_BOOKS[0]
-            )
-            assert create_response.ok
-            created_book = create_response.json()
-            self.created_book_ids.append(created_book["id"])
+        with allure.step("Lease a book with specific title"):
+            self.pool.lease(0)
 
         with allure.step("Search for the book"):
             search_response = self.client.get(f"{self.client.base_url}{BASE_PATH}?q=Python Test Book 1")
@@ -122,36 +116,29 @@ class TestBookAPI:
     @allure.title("Test GET all books - With Pagination")
     def test_get_all_books_with_pagination(self):
         """Test GET all books - With Pagination"""
-        with allure.step("Get initial count of books"):
-            initial_response = self.client.get(f"{self.client.base_url}{BASE_PATH}")
-            assert initial_response.ok
-            initial_books = initial_response.json()
-            initial_count = len(initial_books)
-
-        with allure.step("Create multiple books"):
-            for book in EXAMPLE_BOOKS:
-                create_response = self.client.post(f"{self.client.base_url}{BASE_PATH}", json=book)
-                assert create_response.ok
-                created_book = create_response.json()
-                self.created_book_ids.append(created_book["id"])
+        # Other workers and other runs add and delete books while this runs, so the
+        # checks are on page sizes and on which books a page leaves out, not on exact
+        # ids; the pool guarantees at least len(EXAMPLE_BOOKS) books to page through
+        with allure.step("Test limit"):
+            limit_response = self.client.get(f"{self.client.base_url}{BASE_PATH}?limit={len(EXAMPLE_BOOKS)}")
+            assert limit_response.ok
+            limit_books = limit_response.json()
+            assert len(limit_books) == len(EXAMPLE_BOOKS)
+            first_id = limit_books[0]["id"]
 
         with allure.step("Test skip"):
             skip_response = self.client.get(f"{self.client.base_url}{BASE_PATH}?skip=1")
             assert skip_response.ok
-            skip_books = skip_response.json()
-            assert len(skip_books) <= initial_count + len(self.created_book_ids)
-
-        with allure.step("Test limit"):
-            limit_response = self.client.get(f"{self.client.base_url}{BASE_PATH}?limit=1")
-            assert limit_response.ok
-            limit_books = limit_response.json()
-            assert len(limit_books) <= 1
+            skip_ids = [book["id"] for book in skip_response.json()]
+            assert len(skip_ids) >= len(EXAMPLE_BOOKS) - 1
+            assert first_id not in skip_ids
 
         with allure.step("Test skip and limit together"):
             paginated_response = self.client.get(f"{self.client.base_url}{BASE_PATH}?skip=1&limit=1")
             assert paginated_response.ok
             paginated_books = paginated_response.json()
-            assert len(paginated_books) <= 1
+            assert len(paginated_books) == 1
+            assert paginated_books[0]["id"] != first_id
 
     @allure.story("Create Book")
     @allure.severity(allure.severity_level.CRITICAL)
@@ -171,11 +158,8 @@ class TestBookAPI:
     @allure.title("Test GET single book")
     def test_get_single_book(self):
         """Test GET single book"""
-        with allure.step("Create a book first"):
-            create_response = self.client.post(f"{self.client.base_url}{BASE_PATH}", json=EXAMPLE_BOOKS[0])
-            assert create_response.ok
-            created_book = create_response.json()
-            self.created_book_ids.append(created_book["id"])
+        with allure.step("Lease a book"):
+            created_book = self.pool.lease(0)
 
         with allure.step("Get the created book"):
             response = self.client.get(f"{self.client.base_url}{BASE_PATH}/{created_book['id']}")
@@ -188,11 +172,8 @@ class TestBookAPI:
     @allure.title("Test PUT update book")
     def test_update_book(self):
         """Test PUT update book"""
-        with allure.step("Create a book first"):
-            create_response = self.client.post(f"{self.client.base_url}{BASE_PATH}", json=EXAMPLE_BOOKS[0])
-            assert create_response.ok
-            created_book = create_response.json()
-            self.created_book_ids.append(created_book["id"])
+        with allure.step("Get a book of our own"):
+            created_book = self.pool.writable()
 
         with allure.step("Update the book"):
             updated_title = "Updated Book Title"
@@ -210,11 +191,8 @@ class TestBookAPI:
     @allure.title("Test DELETE book")
     def test_delete_book(self):
         """Test DELETE book"""
-        with allure.step("Create a book first"):
-            create_response = self.client.post(f"{self.client.base_url}{BASE_PATH}", json=EXAMPLE_BOOKS[0])
-            assert create_response.ok
-            created_book = create_response.json()
-            self.created_book_ids.append(created_book["id"])
+        with allure.step("Get a book of our own"):
+            created_book = self.pool.writable()
 
         with allure.step("Delete the book"):
             response = self.client.delete(f"{self.client.base_url}{BASE_PATH}/{created_book['id']}")
@@ -0,0 +1,147 @@
+import contextlib
+import json
+import os
+import threading
+
+import allure
+import pytest
+
+import test_book_api
+from apiclient.async_client import AsyncApiClient
+from apiclient.data_pool import BookPool
+from apiclient.http_client import ApiClient
+from apiclient.load import LoadStats, run_load
+from apiclient.tokens import is_local
+
+# Every functional scenario of TestBookAPI: create, get, search, filter, sort, paginate, update, delete
+SCENARIOS = sorted(name for name in dir(test_book_api.TestBookAPI) if name.startswith("test_"))
+
+
+class ScenarioBooks:
+    """
+    The BookPool interface for one scenario run. Shared books are leased
+    from the pool; writable books are created with the user's own client,
+    so users never wait for each other, and every book the run created is
+    deleted as soon as it ends, so the book list does not grow over the run.
+    """
+
+    def __init__(self, pool, client):
+        self.pool = pool
+        self.client = client
+        self.created_ids = []
+
+    def lease(self, index=0):
+        return self.pool.lease(index)
+
+    def writable(self):
+        response = self.client.post(f"{self.client.base_url}{test_book_api.BASE_PATH}",
+                                    json=test_book_api.EXAMPLE_BOOKS[0])
+        if not response.ok:
+            raise RuntimeError(f"Could not create a book (status {response.status_code})")
+        book = response.json()
+        self.created_ids.append(book["id"])
+        return book
+
+    def track(self, book_ids):
+        self.created_ids.extend(book_ids)
+
+    def cleanup(self):
+        # Cleanup is not part of the load (and 404s for books a scenario deleted are expected)
+        on_timing, self.client.on_timing = self.client.on_timing, None
+        try:
+            for book_id in self.created_ids:
+                try:
+                    self.client.delete(f"{self.client.base_url}{test_book_api.BASE_PATH}/{book_id}")
+                except Exception:
+                    pass
+        finally:
+            self.client.on_timing = on_timing
+
+
+def make_scenario(name, user_client, pool):
+    """Run one TestBookAPI test the way its setup fixture would, with the calling user's client"""
+    def run():
+        client = user_client()
+        books = ScenarioBooks(pool, client)
+        scenario = test_book_api.TestBookAPI()
+        scenario.client = client
+        scenario.pool = books
+        scenario.created_book_ids = []
+        try:
+            getattr(scenario, name)()
+        finally:
+            books.track(scenario.created_book_ids)
+            books.cleanup()
+    return run
+
+
+@allure.epic("Book API")
+@allure.feature("Load")
+@allure.title("Book API scenarios under load")
+def test_book_api_load(base_url, api_client_options, monkeypatch, capsys):
+    """
+    Runs the TestBookAPI scenarios concurrently for API_LOAD_DURATION seconds,
+    with API_LOAD_USERS users (default 8) or at API_LOAD_RATE scenarios per
+    second, and reports throughput, error rate and latency per endpoint.
+    Anything but a local server (the stub) needs API_LOAD_ALLOW_REMOTE=true.
+    """
+    if not is_local(base_url) and os.getenv('API_LOAD_ALLOW_REMOTE', 'false').lower() != 'true':
+        pytest.skip(f"Not generating load against {base_url}: use API_BASE_URL=stub, "
+                    f"or set API_LOAD_ALLOW_REMOTE=true for a server you may load test")
+    duration = float(os.getenv('API_LOAD_DURATION'))
+    users = int(os.getenv('API_LOAD_USERS', '8'))
+    rate = float(os.getenv('API_LOAD_RATE', '0')) or None
+    max_error_rate = float(os.getenv('API_LOAD_MAX_ERROR_RATE', '0.01'))
+
+    stats = LoadStats()
+    clients = []
+    local = threading.local()
+
+    def user_client():
+        """Each user (thread) sends its requests through a client of its own"""
+        if not hasattr(local, "client"):
+            local.client = ApiClient(base_url, on_timing=stats.record_request, **api_client_options)
+            clients.append(local.client)
+        return local.client
+
+    # Only seeds and removes the shared books, outside of the measured load
+    pool_client = AsyncApiClient(base_url, concurrency=users, **api_client_options)
+    pool = BookPool(pool_client, test_book_api.BASE_PATH, spares=0)
+    # The scenarios' own steps would add thousands of Allure steps; only the load report is attached
+    monkeypatch.setattr(allure, "step", lambda title: contextlib.nullcontext())
+
+    try:
+        pool.seed(test_book_api.EXAMPLE_BOOKS)
+        scenarios = {name: make_scenario(name, user_client, pool) for name in SCENARIOS}
+        elapsed = run_load(scenarios, stats, duration, users=users, rate=rate)
+    finally:
+        pool.cleanup()
+        pool_client.close()
+        for client in clients:
+            client.close()
+    monkeypatch.undo()
+
+    summary = stats.summary(elapsed)
+    profile = f"{rate:g} scenarios/s" if rate else f"{users} users"
+    header = f"Book API load: {profile} for {elapsed:.1f}s against {base_url}"
+    with allure.step(header):
+        allure.attach(summary, name="Summary", attachment_type=allure.attachment_type.TEXT)
+        for name, endpoint in sorted(stats.endpoints.items()):
+            allure.attach(endpoint["histogram"].distribution(), name=f"Latency histogram {name}",
+                          attachment_type=allure.attachment_type.TEXT)
+        allure.attach(json.dumps({
+            name: {
+                "requests": endpoint["histogram"].total,
+                "errors": endpoint["errors"],
+                **{f"p{p}_ms": endpoint["histogram"].percentile(p) / 1000 for p in (50, 95, 99)},
+            } for name, endpoint in stats.endpoints.items()
+        }, indent=2), name="Summary JSON", attachment_type=allure.attachment_type.JSON)
+    with capsys.disabled():
+        print(f"\n{header}\n{summary}")
+
+    assert stats.requests, "No requests were made"
+    error_rate = stats.request_errors / stats.requests
+    assert error_rate <= max_error_rate, f"Error rate {error_rate:.2%} above {max_error_rate:.2%}"
+    # A scenario whose checks fail under load is as much a problem as a failing request
+    failure_rate = stats.scenario_failures / stats.scenario_runs
+    assert failure_rate <= max_error_rate, f"Scenario failure rate {failure_rate:.2%} above {max_error_rate:.2%}"
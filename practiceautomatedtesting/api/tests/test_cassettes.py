@@ -0,0 +1,43 @@
+import allure
+from apiclient.cassettes import Cassette, use_cassette, RECORD, STRICT
+from apiclient.http_client import ApiClient
+from apiclient.stub_server import StubServer, BOOKS_PATH
+from apiclient.sweeper import run_tagged
+
+BOOK = {
+    "title": "Python Test Book 1",
+    "author": "Test Author 1",
+    "price": 12.99,
+    "description": "A book created by Python tests.",
+    "category": "Testing"
+}
+
+@allure.epic("Book API")
+@allure.feature("Record/Replay")
+class TestCassettes:
+    @allure.story("Strict Replay")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.title("Test a recording replays in strict mode in a later run")
+    def test_strict_replay_in_a_later_run(self, tmp_path):
+        """Books carry the id of the run that created them; a later run must still match the recording"""
+        path = str(tmp_path / "api.json.gz")
+        server = StubServer().start()
+        try:
+            with allure.step("Record creating a book in one run"):
+                cassette = Cassette(path)
+                client = ApiClient(server.url)
+                use_cassette(client, cassette, RECORD)
+                recorded = client.post(f"{server.url}{BOOKS_PATH}", json=run_tagged([BOOK], "1000-aaaa")[0])
+                assert recorded.status_code == 201
+                client.close()
+                cassette.save()
+        finally:
+            server.stop()
+
+        with allure.step("Replay it strictly in another run, with the server gone"):
+            client = ApiClient(server.url)
+            use_cassette(client, Cassette(path), STRICT)
+            replayed = client.post(f"{server.url}{BOOKS_PATH}", json=run_tagged([BOOK], "2000-bbbb")[0])
+            client.close()
+            assert replayed.status_code == 201
+            assert replayed.json() == recorded.json()
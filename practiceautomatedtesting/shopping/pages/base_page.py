@@ -0,0 +1,79 @@
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+class BasePage:
+    # Finds elements inside the page, where the driver's implicit wait does not apply
+    FIND_ELEMENTS_JS = """
+        const find = (using, value) => {
+            if (using === 'xpath') {
+                const result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                return Array.from({length: result.snapshotLength}, (_, i) => result.snapshotItem(i));
+            }
+            return Array.from(document.querySelectorAll(value));
+        };
+    """
+    PROBE_SCRIPT = FIND_ELEMENTS_JS + "return find(arguments[0], arguments[1]);"
+    # Name of the first signal with a visible match, or null
+    ANY_OF_SCRIPT = FIND_ELEMENTS_JS + """
+        const visible = el => el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden';
+        for (const [name, using, value] of arguments[0]) {
+            if (find(using, value).some(visible)) return name;
+        }
+        return null;
+    """
+
+    def __init__(self, driver, timeout=10):
+        self.driver = driver
+        self.wait = WebDriverWait(driver, timeout)
+
+    @staticmethod
+    def _probe_query(locator):
+        """Translate a locator into an XPath or CSS query, the way WebDriver does"""
+        by, value = locator
+        if by == By.XPATH:
+            return "xpath", value
+        if by == By.CSS_SELECTOR:
+            return "css", value
+        if by == By.ID:
+            return "css", f'[id="{value}"]'
+        if by == By.NAME:
+            return "css", f'[name="{value}"]'
+        if by == By.CLASS_NAME:
+            return "css", f".{value}"
+        if by == By.TAG_NAME:
+            return "css", value
+        raise ValueError(f"Locator strategy {by!r} cannot be probed")
+
+    def probe(self, locator, timeout=0):
+        """
+        Return the elements matching locator right away (or within timeout
+        seconds), as an empty list if there are none. The lookup runs in
+        the page, so it never raises and no implicit wait applies.
+        """
+        query = self._probe_query(locator)
+        found = self.driver.execute_script(self.PROBE_SCRIPT, *query)
+        if found or not timeout:
+            return found
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                lambda driver: driver.execute_script(self.PROBE_SCRIPT, *query)
+            )
+        except TimeoutException:
+            return []
+
+    def wait_for_any(self, signals, timeout=10):
+        """
+        Wait until one of several outcomes shows up and return its name.
+
+        signals maps a name to a locator, in priority order. Every poll
+        checks all of them in a single script call and the first one with
+        a visible match wins. Returns None if none shows up within timeout.
+        """
+        queries = [[name, *self._probe_query(locator)] for name, locator in signals.items()]
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                lambda driver: driver.execute_script(self.ANY_OF_SCRIPT, queries)
+            )
+        except TimeoutException:
+            return None
@@ -1,12 +1,12 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import WebDriverException
+from pages.base_page import BasePage
 import logging
-import time
 
 logger = logging.getLogger(__name__)
 
-class CheckoutPage:
+class CheckoutPage(BasePage):
     # URL
     URL = "https://practiceautomatedtesting.com/checkout"
     
@@ -16,6 +16,7 @@ class CheckoutPage:
     ITEM_PRICE = (By.CSS_SELECTOR, "td:nth-child(3)")
     REMOVE_BUTTON = (By.CSS_SELECTOR, "button.Checkout_deleteButton__AxZ8\\+")
     CART_TOTAL = (By.CSS_SELECTOR, ".Checkout_amount__r+Nl4")
+    EMPTY_CART = (By.CSS_SELECTOR, ".Checkout_emptyCart__FMywP")
     
     # Payment fields
     CARD_NAME = (By.ID, "cc-name")
@@ -31,9 +32,19 @@ class CheckoutPage:
     # Success message locator
     SUCCESS_MESSAGE = (By.CSS_SELECTOR, ".successText")
     
+    # Payment outcomes, checked together in one poll (first match wins)
+    PAYMENT_RESULTS = {
+        "success_overlay": (By.XPATH, "//*[contains(@class, 'Checkout_successOverlay__6TzsH')]"
+                                      "//*[contains(@class, 'Checkout_successText__IEOTx')][normalize-space()='Payment Successful!']"),
+        "success_card": (By.CSS_SELECTOR, ".successCard"),
+        "success_text": (By.XPATH, "//body//*[contains(text(), 'Payment Successful!')]"),
+        "invalid_input": (By.CSS_SELECTOR, "form[aria-labelledby='payment-form-title'] [aria-invalid='true']")
+    }
+    PAYMENT_SUCCESS = ("success_overlay", "success_card", "success_text")
+    PAYMENT_TIMEOUT = 10
+    
     def __init__(self, driver):
-        self.driver = driver
-        self.wait = WebDriverWait(driver, 5)
+        super().__init__(driver, timeout=5)
     
     def navigate(self):
         """Navigate to the checkout page"""
@@ -43,12 +54,12 @@ class CheckoutPage:
         try:
             self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "table.Checkout_cartTable__wp05q")))
         except:
-            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".Checkout_emptyCart__FMywP")))
+            self.wait.until(EC.presence_of_element_located(self.EMPTY_CART))
     
     def get_cart_items(self):
         """Get all items in the cart"""
         try:
-            empty_cart = self.driver.find_elements(By.CSS_SELECTOR, ".Checkout_emptyCart__FMywP")
+            empty_cart = self.probe(self.EMPTY_CART)
             if empty_cart and empty_cart[0].is_displayed():
                 return []
             items = self.driver.find_elements(*self.CART_ITEMS)
@@ -125,24 +136,7 @@ class CheckoutPage:
         pay_button = self.wait.until(EC.element_to_be_clickable(self.PAY_NOW_BUTTON))
         pay_button.click()
         
-        # Wait for payment form to be submitted
-        self.wait.until(EC.invisibility_of_element_located((By.CSS_SELECTOR, "form[aria-labelledby='payment-form-title']")))
-        
-        # Check for success states with a single wait
-        try:
-            # First check for success overlay
-            success_overlay = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".Checkout_successOverlay__6TzsH")))
-            if success_overlay.is_displayed():
-                success_text = self.driver.find_element(By.CSS_SELECTOR, ".Checkout_successText__IEOTx")
-                return success_text.text == "Payment Successful!"
-        except:
-            # If overlay not found, check for success page
-            try:
-                success_message = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".successCard")))
-                return success_message.is_displayed()
-            except:
-                # Final fallback: Check page source
-                return "Payment Successful!" in self.driver.page_source
+        return self.wait_for_payment_result() in self.PAYMENT_SUCCESS
     
     def place_order(self):
         """Click the place order button"""
@@ -150,27 +144,20 @@ class CheckoutPage:
         place_order_button = self.wait.until(EC.element_to_be_clickable(self.PAY_NOW_BUTTON))
         place_order_button.click()
     
+    def wait_for_payment_result(self):
+        """
+        Wait for the first payment outcome to show up and return its name
+        (a key of PAYMENT_RESULTS), or None if there is none in time
+        """
+        result = self.wait_for_any(self.PAYMENT_RESULTS, timeout=self.PAYMENT_TIMEOUT)
+        logger.info(f"Payment result: {result}")
+        return result
+    
     def verify_order_success(self):
         """Verify if order was placed successfully"""
+        # Only browser errors mean "no success"; anything else is a bug in the page object
         try:
-            # Wait for the payment form to be submitted
-            self.wait.until(EC.invisibility_of_element_located((By.CSS_SELECTOR, "form[aria-labelledby='payment-form-title']")))
-            
-            # Check for success states with a single wait
-            try:
-                # First check for success overlay
-                success_overlay = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".Checkout_successOverlay__6TzsH")))
-                if success_overlay.is_displayed():
-                    success_text = self.driver.find_element(By.CSS_SELECTOR, ".Checkout_successText__IEOTx")
-                    return success_text.text == "Payment Successful!"
-            except:
-                # If overlay not found, check for success page
-                try:
-                    success_message = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".successCard")))
-                    return success_message.is_displayed()
-                except:
-                    # Final fallback: Check page source
-                    return "Payment Successful!" in self.driver.page_source
-        except Exception as e:
+            return self.wait_for_payment_result() in self.PAYMENT_SUCCESS
+        except WebDriverException as e:
             logger.error(f"Error verifying order success: {str(e)}")
-            return False 
\ No newline at end of file
+            return False
@@ -1,12 +1,12 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
+from pages.base_page import BasePage
 import logging
 
 logger = logging.getLogger(__name__)
 
-class ShoppingPage:
+class ShoppingPage(BasePage):
     # URL
     URL = "https://practiceautomatedtesting.com/webelements"
     
@@ -28,9 +28,28 @@ class ShoppingPage:
     CART_ICON = (By.CSS_SELECTOR, "nav ul li:nth-child(5) a")
     CART_COUNT = (By.CSS_SELECTOR, ".cart-count")
     
+    # Reads all visible product cards in one round trip; innerText matches WebElement.text
+    PRODUCTS_SCRIPT = """
+        const [cardSelector, nameSelector, priceSelector, buttonSelector] = arguments;
+        const text = (card, selector) => {
+            const el = card.querySelector(selector);
+            return el ? el.innerText.trim() : '';
+        };
+        return Array.from(document.querySelectorAll(cardSelector))
+            .filter(card => card.getClientRects().length > 0)
+            .map(card => {
+                const button = card.querySelector(buttonSelector);
+                return {
+                    name: text(card, nameSelector),
+                    price: text(card, priceSelector),
+                    aria_label: button ? button.getAttribute('aria-label') : null,
+                    add_button_enabled: button !== null && !button.disabled
+                };
+            });
+    """
+    
     def __init__(self, driver):
-        self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        super().__init__(driver, timeout=10)
         self.actions = ActionChains(driver)
     
     def navigate(self):
@@ -90,9 +109,10 @@ class ShoppingPage:
         """Add a product to cart by name"""
         logger.info(f"Adding product {product_name} to cart")
         try:
-            # Get current cart count
+            # Get current cart count (no badge yet means an empty cart)
             try:
-                current_count = int(self.driver.find_element(*self.CART_COUNT).text)
+                badge = self.probe(self.CART_COUNT)
+                current_count = int(badge[0].text) if badge else 0
             except:
                 current_count = 0
             
@@ -108,8 +128,8 @@ class ShoppingPage:
             # Wait for cart count to update
             def cart_count_updated(driver):
                 try:
-                    new_count = int(driver.find_element(*self.CART_COUNT).text)
-                    return new_count > current_count
+                    badge = self.probe(self.CART_COUNT)
+                    return bool(badge) and int(badge[0].text) > current_count
                 except:
                     return False
             
@@ -131,15 +151,23 @@ class ShoppingPage:
         # Wait for cart page to load
         self.wait.until(EC.url_contains("checkout"))
     
+    def get_products(self):
+        """
+        Get every visible product card as a dict with name, price,
+        aria_label and add_button_enabled, read in a single script call
+        """
+        return self.driver.execute_script(
+            self.PRODUCTS_SCRIPT,
+            self.PRODUCT_CARDS[1], self.PRODUCT_NAMES[1], self.PRODUCT_PRICES[1], self.ADD_TO_CART_BUTTONS[1]
+        )
+    
     def get_product_names(self):
         """Get all product names"""
-        names = self.driver.find_elements(*self.PRODUCT_NAMES)
-        return [name.text for name in names]
+        return [product["name"] for product in self.get_products()]
     
     def get_product_prices(self):
         """Get all product prices"""
-        prices = self.driver.find_elements(*self.PRODUCT_PRICES)
-        return [price.text for price in prices]
+        return [product["price"] for product in self.get_products()]
     
     def go_to_page(self, page_number):
         """Navigate to a specific page"""
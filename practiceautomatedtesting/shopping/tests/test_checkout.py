@@ -32,7 +32,7 @@ class TestCheckout:
             self.checkout_page.fill_paypal_email("test@gmail.com")
         
         with allure.step("Submit payment"):
-            self.checkout_page.submit_payment()
+            assert self.checkout_page.submit_payment(), "Payment did not succeed"
         
         with allure.step("Verify order success"):
             assert self.checkout_page.verify_order_success(), "Order was not placed successfully"
@@ -0,0 +1,3 @@
+"""
+Browser helpers shared by the webelements conftest and test classes.
+"""
@@ -0,0 +1,149 @@
+import collections
+import itertools
+import json
+import time
+from urllib.request import urlopen
+
+import websocket
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+
+class BrowserSession:
+    """
+    Browser-level DevTools connection to a running Chrome.
+
+    driver.execute_cdp_cmd() talks to the current tab only, which is not
+    allowed to create or dispose browser contexts. This opens a connection
+    to the browser target through the remote debugging port instead.
+    """
+
+    def __init__(self, driver, timeout=10):
+        address = driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+        with urlopen(f"http://{address}/json/version", timeout=timeout) as response:
+            ws_url = json.load(response)["webSocketDebuggerUrl"]
+        self.timeout = timeout
+        self._ws = websocket.create_connection(ws_url, timeout=timeout, suppress_origin=True)
+        self._ids = itertools.count(1)
+        # Events that arrive while waiting for a command result, oldest first
+        self._events = collections.deque(maxlen=1000)
+
+    def send(self, method, params=None):
+        """Send a CDP command and wait for its result"""
+        message_id = next(self._ids)
+        self._ws.send(json.dumps({"id": message_id, "method": method, "params": params or {}}))
+        while True:
+            message = json.loads(self._ws.recv())
+            if "method" in message:
+                self._events.append(message)
+                continue
+            # Skip replies to other commands
+            if message.get("id") != message_id:
+                continue
+            if "error" in message:
+                raise WebDriverException(f"{method} failed: {message['error'].get('message')}")
+            return message.get("result", {})
+
+    def wait_for_event(self, method, predicate=None, timeout=10):
+        """
+        Wait for a CDP event (only sent for domains the session enabled)
+        and return its params. predicate(params) can narrow the match.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            for event in self._events:
+                if event["method"] == method and (predicate is None or predicate(event["params"])):
+                    self._events.remove(event)
+                    return event["params"]
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException(f"No {method} event within {timeout}s")
+            self._ws.settimeout(remaining)
+            try:
+                message = json.loads(self._ws.recv())
+            except websocket.WebSocketTimeoutException:
+                continue
+            finally:
+                self._ws.settimeout(self.timeout)
+            if "method" in message:
+                self._events.append(message)
+
+    def close(self):
+        try:
+            self._ws.close()
+        except Exception:
+            pass
+
+
+class IsolatedContext:
+    """
+    An incognito-style browser context with its own tab inside an already
+    running Chrome. Cookies, storage and cache are private to the context and
+    are thrown away when it is closed, so a test gets a clean profile without
+    starting a new browser process.
+
+    Usage:
+        with IsolatedContext(driver):
+            driver.get(...)
+    """
+
+    def __init__(self, driver, width=1920, height=1080, permissions=(), download_dir=None):
+        self.driver = driver
+        self.width = width
+        self.height = height
+        self.permissions = list(permissions)
+        self.download_dir = download_dir
+        self.context_id = None
+        self._session = None
+        self._home_handle = None
+
+    def open(self):
+        """Create the context and switch the driver to its tab"""
+        self._home_handle = self.driver.current_window_handle
+        self._session = BrowserSession(self.driver)
+        try:
+            # disposeOnDetach cleans up even if the test process dies
+            self.context_id = self._session.send(
+                "Target.createBrowserContext", {"disposeOnDetach": True}
+            )["browserContextId"]
+            # Profile prefs do not reach new contexts, so apply them here
+            if self.permissions:
+                self._session.send("Browser.grantPermissions", {
+                    "permissions": self.permissions,
+                    "browserContextId": self.context_id
+                })
+            if self.download_dir:
+                self._session.send("Browser.setDownloadBehavior", {
+                    "behavior": "allow",
+                    "downloadPath": self.download_dir,
+                    "browserContextId": self.context_id
+                })
+            target = self._session.send("Target.createTarget", {
+                "url": "about:blank",
+                "browserContextId": self.context_id,
+                "width": self.width,
+                "height": self.height
+            })
+            # ChromeDriver window handles are DevTools target ids
+            self.driver.switch_to.window(target["targetId"])
+        except Exception:
+            self.close()
+            raise
+        return self.driver
+
+    def close(self):
+        """Dispose the context (and every tab in it) and switch back home"""
+        try:
+            if self.context_id:
+                self._session.send("Target.disposeBrowserContext", {"browserContextId": self.context_id})
+        finally:
+            self.context_id = None
+            if self._session:
+                self._session.close()
+                self._session = None
+            self.driver.switch_to.window(self._home_handle)
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,115 @@
+import hashlib
+import os
+from contextlib import contextmanager
+
+from browser.contexts import BrowserSession
+
+DOWNLOAD_TIMEOUT = 60
+CHUNK_SIZE = 1024 * 1024
+
+
+def file_checksum(path, algorithm="sha256", chunk_size=CHUNK_SIZE):
+    """Hash a file in fixed-size chunks, so big files never sit in memory"""
+    digest = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Download:
+    """One finished browser download, as reported by Chrome"""
+
+    def __init__(self, filename, path, state, total_bytes, received_bytes):
+        self.filename = filename
+        self.path = path
+        self.state = state
+        self.total_bytes = total_bytes
+        self.received_bytes = received_bytes
+
+    @property
+    def completed(self):
+        return self.state == "completed"
+
+    def checksum(self, algorithm="sha256"):
+        return file_checksum(self.path, algorithm)
+
+    def verify(self, expected_checksum=None, algorithm="sha256"):
+        """
+        True if the download completed and the file on disk has the size
+        Chrome received (and the expected checksum, when one is given)
+        """
+        if not self.completed or not os.path.exists(self.path):
+            return False
+        if os.path.getsize(self.path) != self.received_bytes:
+            return False
+        return expected_checksum is None or self.checksum(algorithm) == expected_checksum
+
+    def __repr__(self):
+        return f"<Download {self.filename!r} {self.state} {self.received_bytes} bytes>"
+
+
+class DownloadManager:
+    """
+    Watches the downloads of the driver's current tab through CDP
+    (Browser.downloadWillBegin / Browser.downloadProgress) instead of
+    polling the download directory.
+
+    Usage:
+        with downloads.expect_download() as download:
+            download_button.click()
+        assert download.verify()
+    """
+
+    def __init__(self, driver, download_dir):
+        self.driver = driver
+        self.download_dir = download_dir
+        self.downloads = []
+        self._session = None
+
+    def _watch(self):
+        """Route this tab's downloads to download_dir and subscribe to their events"""
+        if self._session:
+            return
+        self._session = BrowserSession(self.driver)
+        # ChromeDriver window handles are target ids; find the tab's context
+        target = self._session.send("Target.getTargetInfo", {"targetId": self.driver.current_window_handle})
+        params = {"behavior": "allow", "downloadPath": self.download_dir, "eventsEnabled": True}
+        context_id = target["targetInfo"].get("browserContextId")
+        if context_id:
+            params["browserContextId"] = context_id
+        self._session.send("Browser.setDownloadBehavior", params)
+
+    @contextmanager
+    def expect_download(self, timeout=DOWNLOAD_TIMEOUT):
+        """
+        Wait for the download started inside the with block to finish.
+        The yielded Download is filled in when the block exits.
+        """
+        os.makedirs(self.download_dir, exist_ok=True)
+        self._watch()
+        download = Download(None, None, "pending", 0, 0)
+        yield download
+
+        begin = self._session.wait_for_event("Browser.downloadWillBegin", timeout=timeout)
+        progress = self._session.wait_for_event(
+            "Browser.downloadProgress",
+            lambda event: event["guid"] == begin["guid"] and event["state"] != "inProgress",
+            timeout=timeout
+        )
+        download.filename = begin["suggestedFilename"]
+        download.path = progress.get("filePath") or os.path.join(self.download_dir, download.filename)
+        download.state = progress["state"]
+        download.total_bytes = progress.get("totalBytes", 0)
+        download.received_bytes = progress.get("receivedBytes", 0)
+        self.downloads.append(download)
+
+    def close(self, remove_files=True):
+        """Stop watching and, by default, delete the files that were downloaded"""
+        if self._session:
+            self._session.close()
+            self._session = None
+        if remove_files:
+            for download in self.downloads:
+                if download.path and os.path.exists(download.path):
+                    os.remove(download.path)
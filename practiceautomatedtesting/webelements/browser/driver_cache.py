@@ -0,0 +1,95 @@
+import json
+import os
+import time
+
+from filelock import FileLock
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+
+CACHE_DIR = os.getenv(
+    'CHROMEDRIVER_CACHE_DIR',
+    os.path.join(os.path.expanduser("~"), ".cache", "pythonfortesters")
+)
+CACHE_FILE = os.path.join(CACHE_DIR, "chromedriver.json")
+LOCK_TIMEOUT = 300
+
+# Resolved once per process; the on-disk cache covers the other workers
+_resolved_path = None
+
+
+def installed_chrome_version():
+    """Return the locally installed Chrome (or Chromium) version, or None"""
+    os_manager = OperationSystemManager()
+    for browser_type in (ChromeType.GOOGLE, ChromeType.CHROMIUM):
+        try:
+            version = os_manager.get_browser_version_from_os(browser_type)
+        except Exception:
+            version = None
+        if version:
+            return version
+    return None
+
+
+def _read_cache():
+    try:
+        with open(CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(entry):
+    tmp_file = f"{CACHE_FILE}.{os.getpid()}.tmp"
+    with open(tmp_file, "w") as f:
+        json.dump(entry, f, indent=2)
+    os.replace(tmp_file, CACHE_FILE)
+
+
+def resolve_chromedriver():
+    """
+    Return the path of a chromedriver binary matching the installed Chrome.
+
+    The first caller runs ChromeDriverManager().install() and pins the result
+    in an on-disk cache; every later call - from this process or from any
+    other xdist worker - reads the pinned path without touching the network.
+    The cache is only re-validated when the installed Chrome version changes.
+    A file lock stops parallel workers from downloading at the same time.
+
+    Returns None when no driver could be resolved, so the caller can fall
+    back to the chromedriver on PATH.
+    """
+    global _resolved_path
+    if _resolved_path and os.path.exists(_resolved_path):
+        return _resolved_path
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    chrome_version = installed_chrome_version()
+
+    with FileLock(f"{CACHE_FILE}.lock", timeout=LOCK_TIMEOUT):
+        entry = _read_cache()
+        cached_path = entry.get("driver_path")
+        cache_usable = cached_path and os.path.exists(cached_path)
+
+        if cache_usable and entry.get("chrome_version") == chrome_version:
+            _resolved_path = cached_path
+            return _resolved_path
+
+        try:
+            driver_path = ChromeDriverManager().install()
+        except Exception as e:
+            print(f"WebDriver Manager failed: {e}")
+            if cache_usable:
+                # Offline: a driver for an older Chrome beats no driver at all
+                print(f"Using cached chromedriver for Chrome {entry.get('chrome_version')}")
+                _resolved_path = cached_path
+                return _resolved_path
+            return None
+
+        _write_cache({
+            "chrome_version": chrome_version,
+            "driver_path": driver_path,
+            "resolved_at": time.strftime("%Y-%m-%d %H:%M:%S")
+        })
+
+    _resolved_path = driver_path
+    return _resolved_path
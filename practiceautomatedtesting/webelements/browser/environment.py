@@ -0,0 +1,51 @@
+import glob
+import json
+import os
+
+WORKER_FILE_PATTERN = "environment-*.json"
+
+
+def browser_info(driver):
+    """Collect the environment details shown in the Allure report"""
+    return {
+        "Browser": driver.capabilities.get("browserName", "Unknown"),
+        "Browser Version": driver.capabilities.get("browserVersion", "Unknown"),
+        "Platform": driver.capabilities.get("platformName", "Unknown"),
+        "Headless": os.getenv('CHROME_HEADLESS', 'false').lower() == 'true'
+    }
+
+
+def write_worker_environment(results_dir, worker_id, info):
+    """Store one worker's environment info until the session merges it"""
+    os.makedirs(results_dir, exist_ok=True)
+    with open(os.path.join(results_dir, f"environment-{worker_id}.json"), "w") as f:
+        json.dump(info, f)
+
+
+def merge_environment(results_dir):
+    """
+    Merge the per-worker files into allure's environment.properties.
+    Values that differ between workers are listed together.
+    """
+    worker_files = sorted(glob.glob(os.path.join(results_dir, WORKER_FILE_PATTERN)))
+    if not worker_files:
+        return
+
+    merged = {}
+    for path in worker_files:
+        try:
+            with open(path) as f:
+                info = json.load(f)
+        except (OSError, ValueError):
+            continue
+        for key, value in info.items():
+            values = merged.setdefault(key, [])
+            if str(value) not in values:
+                values.append(str(value))
+
+    with open(os.path.join(results_dir, "environment.properties"), "w") as f:
+        for key, values in merged.items():
+            f.write(f"{key}={', '.join(values)}\n")
+
+    for path in worker_files:
+        os.remove(path)
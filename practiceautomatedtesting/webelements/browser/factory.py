@@ -0,0 +1,133 @@
+import os
+import random
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from browser.driver_cache import resolve_chromedriver
+
+IMPLICIT_WAIT = 10
+DEFAULT_PROFILE = "lean"
+DOWNLOADS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "downloads")
+
+
+def _add_prefs(chrome_options, prefs):
+    """Merge Chrome preferences into the options"""
+    merged = dict(chrome_options.experimental_options.get("prefs", {}))
+    merged.update(prefs)
+    chrome_options.add_experimental_option("prefs", merged)
+
+
+def _enable_downloads(chrome_options, download_dir):
+    """Save downloads to download_dir without prompting"""
+    _add_prefs(chrome_options, {
+        "download.default_directory": download_dir or DOWNLOADS_DIR,
+        "download.prompt_for_download": False,
+        "download.directory_upgrade": True,
+        "safebrowsing.enabled": True
+    })
+
+
+def _enable_geolocation(chrome_options, download_dir):
+    """Allow pages to ask for the current position"""
+    _add_prefs(chrome_options, {
+        "profile.default_content_setting_values.geolocation": 1  # 1:allow, 2:block
+    })
+
+
+# Named launch profiles. Every profile starts from the lean base options
+# and adds what the tests using it need on top.
+PROFILES = {
+    "lean": None,
+    "downloads": _enable_downloads,
+    "geolocation": _enable_geolocation,
+}
+
+# Browser permissions a profile needs inside an isolated browser context,
+# where the profile-wide content settings above do not apply
+PROFILE_PERMISSIONS = {
+    "geolocation": ["geolocation"],
+}
+
+
+def build_chrome_options(profile=DEFAULT_PROFILE, download_dir=None):
+    """
+    Build Chrome options for a launch profile.
+    Handles both local development and CI/CD environments.
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown driver profile '{profile}'. Available: {', '.join(PROFILES)}")
+
+    # Set up Chrome options
+    chrome_options = Options()
+
+    # Only add user data directory if explicitly set (CI environment)
+    chrome_user_data_dir = os.getenv('CHROME_USER_DATA_DIR')
+    if chrome_user_data_dir:
+        chrome_options.add_argument(f"--user-data-dir={chrome_user_data_dir}")
+
+    # Check if running in headless environment (GitHub Actions)
+    if os.getenv('CHROME_HEADLESS', 'false').lower() == 'true':
+        chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--window-size=1920,1080")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-plugins")
+    else:
+        # Local development - maximize window
+        chrome_options.add_argument("--start-maximized")
+
+    # Additional options for stability
+    chrome_options.add_argument("--disable-web-security")
+    chrome_options.add_argument("--allow-running-insecure-content")
+
+    # Parallel execution improvements
+    debug_port = random.randint(9222, 9299)
+    chrome_options.add_argument(f"--remote-debugging-port={debug_port}")
+    chrome_options.add_argument("--disable-background-timer-throttling")
+    chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+    chrome_options.add_argument("--disable-renderer-backgrounding")
+
+    # Cache clearing options for CI/CD
+    chrome_options.add_argument("--disable-application-cache")
+    chrome_options.add_argument("--disable-cache")
+    chrome_options.add_argument("--disable-offline-load-stale-cache")
+    chrome_options.add_argument("--disk-cache-size=0")
+    chrome_options.add_argument("--media-cache-size=0")
+
+    # Set user agent
+    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+
+    customize = PROFILES[profile]
+    if customize:
+        customize(chrome_options, download_dir)
+
+    return chrome_options
+
+
+def create_chrome_driver(profile=DEFAULT_PROFILE, download_dir=None):
+    """Launch a Chrome WebDriver instance for a launch profile"""
+    chrome_options = build_chrome_options(profile, download_dir)
+
+    try:
+        # Use the chromedriver pinned by webdriver-manager for this Chrome version
+        driver_path = resolve_chromedriver()
+        if not driver_path:
+            raise RuntimeError("no cached or downloadable chromedriver")
+        service = Service(driver_path)
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+    except Exception as e:
+        print(f"WebDriver Manager failed: {e}")
+        try:
+            # Fallback to system ChromeDriver
+            driver = webdriver.Chrome(options=chrome_options)
+        except Exception as e2:
+            print(f"System ChromeDriver failed: {e2}")
+            # Last resort - try without service
+            driver = webdriver.Chrome(options=chrome_options)
+
+    # Set implicit wait
+    driver.implicitly_wait(IMPLICIT_WAIT)
+
+    return driver
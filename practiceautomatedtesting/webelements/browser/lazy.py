@@ -0,0 +1,29 @@
+class LazyDriver:
+    """
+    Stands in for a WebDriver and only starts the browser the first time a
+    test actually uses it. Every attribute access is forwarded to the real
+    driver, so tests, waits and ActionChains can use it like a WebDriver.
+    """
+
+    def __init__(self, start):
+        self._start = start
+        self._driver = None
+
+    @property
+    def started(self):
+        """True once the real browser has been launched or leased"""
+        return self._driver is not None
+
+    @property
+    def wrapped(self):
+        """The real WebDriver, starting it if needed"""
+        if self._driver is None:
+            self._driver = self._start()
+        return self._driver
+
+    def __getattr__(self, name):
+        return getattr(self.wrapped, name)
+
+    def __repr__(self):
+        state = repr(self._driver) if self.started else "not started"
+        return f"<LazyDriver {state}>"
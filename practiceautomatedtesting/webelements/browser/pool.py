@@ -0,0 +1,186 @@
+import os
+import queue
+import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+
+class DriverPool:
+    """
+    A pool of pre-launched Chrome WebDriver instances.
+
+    Browsers are leased to tests with acquire() and handed back with release().
+    Between leases a browser is reset (cookies, storage, extra windows and
+    downloads) instead of being restarted. A browser is recycled - quit and
+    replaced by a freshly launched one - after max_leases leases, or as soon
+    as it stops responding. Launching and quitting happen on a background
+    thread so the next test does not wait for them.
+
+    The pool lives in a session-scoped fixture, so under pytest-xdist every
+    worker gets its own pool.
+    """
+
+    def __init__(self, factory, size=1, max_leases=25, implicit_wait=10, download_dir=None):
+        self._factory = factory
+        self._max_leases = max_leases
+        self._implicit_wait = implicit_wait
+        self._download_dir = download_dir
+        self._lease_counts = {}
+        self._idle = queue.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=size * 2, thread_name_prefix="driver-pool")
+
+        # Warm up the pool so the first test does not pay the cold start
+        for _ in range(size):
+            self._idle.put(self._executor.submit(self._launch))
+
+    def acquire(self, timeout=120):
+        """Lease a ready-to-use driver from the pool"""
+        future = self._idle.get(timeout=timeout)
+        try:
+            driver = future.result()
+        except Exception:
+            # Keep the slot filled so the next test can try again
+            self._idle.put(self._executor.submit(self._launch))
+            raise
+
+        if not self._is_alive(driver):
+            self._discard(driver)
+            driver = self._launch()
+
+        self._lease_counts[driver.session_id] = self._lease_counts.get(driver.session_id, 0) + 1
+        return driver
+
+    def release(self, driver, reset=True):
+        """
+        Return a leased driver, resetting or recycling it. Pass reset=False
+        when the test ran in an isolated context and left the browser clean.
+        """
+        leases = self._lease_counts.get(driver.session_id, 0)
+        clean = self._reset(driver) if reset else self._restore_timeouts(driver)
+
+        if leases < self._max_leases and clean:
+            ready = Future()
+            ready.set_result(driver)
+            self._idle.put(ready)
+            return
+
+        # Worn out or crashed - replace it in the background
+        self._executor.submit(self._discard, driver)
+        self._idle.put(self._executor.submit(self._launch))
+
+    def close(self):
+        """Quit every browser owned by the pool"""
+        while True:
+            try:
+                future = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                self._discard(future.result())
+            except Exception:
+                pass
+        self._executor.shutdown(wait=True)
+
+    def _launch(self):
+        driver = self._factory()
+        if self._download_dir:
+            os.makedirs(self._download_dir, exist_ok=True)
+            driver.execute_cdp_cmd("Browser.setDownloadBehavior", {
+                "behavior": "allow",
+                "downloadPath": self._download_dir
+            })
+        return driver
+
+    def _discard(self, driver):
+        self._lease_counts.pop(driver.session_id, None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _is_alive(driver):
+        try:
+            driver.window_handles
+            return True
+        except WebDriverException:
+            return False
+
+    def _restore_timeouts(self, driver):
+        try:
+            driver.implicitly_wait(self._implicit_wait)
+            return True
+        except WebDriverException:
+            return False
+
+    def _reset(self, driver):
+        """
+        Bring a browser back to a clean state. Returns False if the browser
+        could not be reset and has to be recycled instead.
+        """
+        try:
+            # Remember which sites were visited so their storage can be wiped
+            old_handles = driver.window_handles
+            origins = set()
+            for handle in old_handles:
+                driver.switch_to.window(handle)
+                url = urlsplit(driver.current_url)
+                if url.scheme in ("http", "https"):
+                    origins.add(f"{url.scheme}://{url.netloc}")
+
+            # A brand new tab drops sessionStorage and history; close the rest
+            driver.switch_to.new_window("tab")
+            fresh_handle = driver.current_window_handle
+            for handle in old_handles:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(fresh_handle)
+
+            # Cookies, localStorage, IndexedDB, cache storage, service workers
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            for origin in origins:
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                    "origin": origin,
+                    "storageTypes": "all"
+                })
+
+            driver.implicitly_wait(self._implicit_wait)
+        except WebDriverException:
+            return False
+
+        if self._download_dir and os.path.isdir(self._download_dir):
+            for name in os.listdir(self._download_dir):
+                path = os.path.join(self._download_dir, name)
+                if os.path.isdir(path):
+                    shutil.rmtree(path, ignore_errors=True)
+                else:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+        return True
+
+
+class ProfilePools:
+    """
+    One DriverPool per launch profile. Pools are created on first use, apart
+    from the profiles listed in warm, which start launching immediately.
+    """
+
+    def __init__(self, make_pool, warm=()):
+        self._make_pool = make_pool
+        self._pools = {}
+        for profile in warm:
+            self.get(profile)
+
+    def get(self, profile):
+        """Return the pool for a profile, creating it if needed"""
+        if profile not in self._pools:
+            self._pools[profile] = self._make_pool(profile)
+        return self._pools[profile]
+
+    def close(self):
+        for pool in self._pools.values():
+            pool.close()
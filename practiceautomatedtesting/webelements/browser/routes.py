@@ -0,0 +1,156 @@
+import json
+import os
+import time
+from urllib.parse import urldefrag
+
+from filelock import FileLock
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from browser.driver_cache import CACHE_DIR
+
+BASE_URL = "https://practiceautomatedtesting.com/webelements"
+ROUTES_FILE = os.path.join(CACHE_DIR, "webelements_routes.json")
+ROUTES_MAX_AGE = 7 * 24 * 3600  # re-crawl the sidebar once a week
+DEEP_LINK_TIMEOUT = 10
+
+# Reads every sidebar link as [section, link text, href] in document order
+CRAWL_SCRIPT = """
+const routes = [];
+document.querySelectorAll('details').forEach(section => {
+    const summary = section.querySelector('summary');
+    section.querySelectorAll('a[href]').forEach(link => {
+        routes.push([summary ? summary.textContent.trim() : '', link.textContent.trim(), link.href]);
+    });
+});
+return routes;
+"""
+
+
+class RouteRegistry:
+    """
+    Maps webelements component names (the sidebar link texts) to direct URLs.
+
+    The sidebar is crawled once and the result is cached on disk, shared by
+    all xdist workers. Links that only change state on the /webelements page
+    itself are not deep links and are left out, so those components keep
+    using the menu.
+    """
+
+    def __init__(self, routes_file=ROUTES_FILE, max_age=ROUTES_MAX_AGE):
+        self.routes_file = routes_file
+        self.max_age = max_age
+        self._routes = None
+        self._broken = set()
+
+    def _load(self):
+        try:
+            if time.time() - os.path.getmtime(self.routes_file) > self.max_age:
+                return None
+            with open(self.routes_file) as f:
+                return json.load(f)["routes"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _save(self, routes):
+        os.makedirs(os.path.dirname(self.routes_file), exist_ok=True)
+        with FileLock(f"{self.routes_file}.lock", timeout=60):
+            tmp_file = f"{self.routes_file}.{os.getpid()}.tmp"
+            with open(tmp_file, "w") as f:
+                json.dump({"base_url": BASE_URL, "routes": routes}, f, indent=2)
+            os.replace(tmp_file, self.routes_file)
+
+    @property
+    def known(self):
+        """True once routes are available without crawling"""
+        if self._routes is None:
+            self._routes = self._load()
+        return self._routes is not None
+
+    def crawl(self, driver):
+        """Learn the routes from the sidebar of the page the driver is on"""
+        base = urldefrag(BASE_URL)[0].rstrip("/")
+        routes = []
+        for section, name, href in driver.execute_script(CRAWL_SCRIPT):
+            url = urldefrag(href)[0].rstrip("/")
+            if url and url != base:
+                routes.append({"section": section, "name": name, "url": href})
+        self._routes = routes
+        self._save(routes)
+
+    def url_for(self, name):
+        """Direct URL of a component, or None if there is no working deep link"""
+        if name in self._broken or not self.known:
+            return None
+        # Exact name first, then the first link containing it (like the XPath)
+        for route in self._routes:
+            if route["name"] == name:
+                return route["url"]
+        for route in self._routes:
+            if name in route["name"]:
+                return route["url"]
+        return None
+
+    def forget(self, name):
+        """Stop using a deep link that did not lead to the component"""
+        self._broken.add(name)
+        # Keep the entry so a lookup does not fall through to a similar name
+        for route in self._routes or []:
+            if route["name"] == name:
+                route["url"] = None
+        self._save(self._routes or [])
+
+
+ROUTES = RouteRegistry()
+
+
+def open_component(driver, section, name, ready_locator, timeout=10):
+    """
+    Open a webelements component and wait until ready_locator is visible.
+
+    Navigates straight to the component's deep link when one is known and
+    falls back to clicking through the sidebar (section accordion, then the
+    component link) when it is not, or when the deep link fails.
+    """
+    on_base_page = False
+    if not ROUTES.known:
+        driver.get(BASE_URL)
+        on_base_page = True
+        try:
+            WebDriverWait(driver, timeout).until(
+                EC.presence_of_element_located((By.XPATH, "//summary"))
+            )
+            ROUTES.crawl(driver)
+        except Exception as e:
+            print(f"Could not learn webelements routes: {e}")
+
+    url = ROUTES.url_for(name)
+    if url:
+        driver.get(url)
+        try:
+            WebDriverWait(driver, DEEP_LINK_TIMEOUT).until(EC.visibility_of_element_located(ready_locator))
+            return
+        except TimeoutException:
+            print(f"Deep link for '{name}' failed, falling back to the menu")
+            ROUTES.forget(name)
+            on_base_page = False
+
+    if not on_base_page:
+        driver.get(BASE_URL)
+
+    # Click the section accordion in the sidebar
+    section_menu = WebDriverWait(driver, timeout).until(
+        EC.element_to_be_clickable((By.XPATH, f"//summary[contains(., '{section}')]"))
+    )
+    section_menu.click()
+
+    # Click the component link
+    component_link = WebDriverWait(driver, timeout).until(
+        EC.element_to_be_clickable((By.XPATH, f"//a[contains(., '{name}')]"))
+    )
+    component_link.click()
+
+    # Wait for the component to be visible
+    WebDriverWait(driver, timeout).until(EC.visibility_of_element_located(ready_locator))
@@ -0,0 +1,45 @@
+import base64
+
+import allure
+
+# Format name -> (CDP Page.captureScreenshot format, MIME type, file extension)
+FORMATS = {
+    "png": ("png", "image/png", "png"),
+    "jpeg": ("jpeg", "image/jpeg", "jpg"),
+    "webp": ("webp", "image/webp", "webp"),
+}
+
+
+class ScreenshotCapture:
+    """
+    Failure screenshots, encoded by Chrome.
+
+    Chrome encodes the screenshot in the requested format and quality (CDP
+    Page.captureScreenshot), so nothing is decoded or re-encoded here, and
+    the bytes go straight from memory into the Allure attachment - the
+    only copy the report reads.
+    """
+
+    def __init__(self, image_format="png", quality=80):
+        if image_format not in FORMATS:
+            raise ValueError(f"Unknown screenshot format '{image_format}', expected one of {sorted(FORMATS)}")
+        self.image_format = image_format
+        self.quality = quality
+
+    def capture(self, driver):
+        """Take a screenshot in the configured format and return the encoded bytes"""
+        cdp_format, _, _ = FORMATS[self.image_format]
+        params = {"format": cdp_format}
+        if cdp_format != "png":
+            params["quality"] = self.quality
+        try:
+            return base64.b64decode(driver.execute_cdp_cmd("Page.captureScreenshot", params)["data"])
+        except Exception:
+            if self.image_format != "png":
+                raise
+            return driver.get_screenshot_as_png()
+
+    def attach(self, test_name, data):
+        """Attach a captured screenshot to the current test"""
+        _, mime_type, extension = FORMATS[self.image_format]
+        allure.attach(data, name=f"Screenshot - {test_name}", attachment_type=mime_type, extension=extension)
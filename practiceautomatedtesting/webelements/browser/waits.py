@@ -0,0 +1,147 @@
+from selenium.common.exceptions import TimeoutException
+
+DEFAULT_TIMEOUT = 10
+
+# Runs inside the page and calls back as soon as the condition holds.
+# The condition is re-checked on every DOM mutation (or resize, in "resize"
+# mode) and at the end of CSS transitions/animations, never on a timer.
+OBSERVE_SCRIPT = """
+const [mode, root, condition, args, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const target = root || document.documentElement;
+const check = new Function('root', 'args', condition);
+const started = performance.now();
+const recent = [];
+let checks = 0, last = null, finished = false, observer = null;
+
+function describe(node) {
+    if (!node || node.nodeType !== 1) node = node && node.parentElement;
+    if (!node) return '?';
+    let text = node.tagName.toLowerCase();
+    if (node.id) text += '#' + node.id;
+    const cls = (typeof node.className === 'string' ? node.className : '').trim().split(/\\s+/)[0];
+    if (cls) text += '.' + cls;
+    return text;
+}
+function note(entry) {
+    recent.push(Math.round(performance.now() - started) + 'ms ' + entry);
+    if (recent.length > 10) recent.shift();
+}
+function finish(ok) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    document.removeEventListener('transitionend', onStyle, true);
+    document.removeEventListener('animationend', onStyle, true);
+    clearTimeout(timer);
+    done({ok: ok, elapsed: Math.round(performance.now() - started), checks: checks,
+          last: last, recent: recent});
+}
+function evaluate() {
+    if (finished) return;
+    checks++;
+    try {
+        const value = check(target, args);
+        last = JSON.stringify(value === undefined ? null : value);
+        if (value) finish(true);
+    } catch (e) {
+        last = 'error: ' + e.message;
+    }
+}
+function onStyle(event) {
+    note(event.type + ' ' + describe(event.target));
+    evaluate();
+}
+
+const timer = setTimeout(() => finish(false), timeoutMs);
+if (mode === 'resize') {
+    observer = new ResizeObserver(entries => {
+        entries.forEach(e => note('resize ' + describe(e.target) + ' ' +
+            Math.round(e.contentRect.width) + 'x' + Math.round(e.contentRect.height)));
+        evaluate();
+    });
+    observer.observe(target);
+} else {
+    observer = new MutationObserver(mutations => {
+        mutations.forEach(m => note(m.type + (m.attributeName ? '[' + m.attributeName + ']' : '') +
+            ' ' + describe(m.target)));
+        evaluate();
+    });
+    observer.observe(target, {subtree: true, childList: true, attributes: true, characterData: true});
+    document.addEventListener('transitionend', onStyle, true);
+    document.addEventListener('animationend', onStyle, true);
+}
+evaluate();
+"""
+
+# Visible the same way WebElement.is_displayed() sees it, give or take
+IS_DISPLAYED = """
+const el = document.querySelector(args[0]);
+if (!el || !el.getClientRects().length) return false;
+const style = getComputedStyle(el);
+return style.visibility !== 'hidden' && style.display !== 'none' && parseFloat(style.opacity) > 0;
+"""
+
+
+class DomWaitTimeout(TimeoutException):
+    """Raised when an observed condition is not met in time. The message lists what the page did meanwhile."""
+
+
+def _observe(driver, mode, description, condition, args=(), root=None, timeout=DEFAULT_TIMEOUT):
+    # The in-page timer must fire before the driver's script timeout (30s by default)
+    result = driver.execute_async_script(
+        OBSERVE_SCRIPT, mode, root, condition, list(args), int(timeout * 1000)
+    )
+    if not result["ok"]:
+        recent = "\n  ".join(result["recent"]) or "(no changes)"
+        raise DomWaitTimeout(
+            f"Timed out after {timeout}s waiting for {description}; "
+            f"checked {result['checks']} times, last result: {result['last']}\n"
+            f"Last changes observed:\n  {recent}"
+        )
+    return result["elapsed"]
+
+
+def wait_for_condition(driver, condition, *args, root=None, timeout=DEFAULT_TIMEOUT, description=None):
+    """
+    Wait until a JavaScript condition is truthy.
+
+    condition is a function body that receives `root` (the observed element,
+    the whole document by default) and `args`, e.g.
+    "return root.querySelectorAll(args[0]).length === args[1]".
+    It is re-checked whenever the DOM under root changes. Returns the time
+    taken in milliseconds.
+    """
+    return _observe(driver, "mutation", description or condition.strip(), condition, args, root, timeout)
+
+
+def wait_until_displayed(driver, css_selector, timeout=DEFAULT_TIMEOUT):
+    """Wait until the element matching css_selector is shown"""
+    return _observe(driver, "mutation", f"'{css_selector}' to be displayed",
+                    IS_DISPLAYED, [css_selector], timeout=timeout)
+
+
+def wait_until_hidden(driver, css_selector, timeout=DEFAULT_TIMEOUT):
+    """Wait until the element matching css_selector is hidden or removed"""
+    return _observe(driver, "mutation", f"'{css_selector}' to be hidden",
+                    f"return !(function () {{ {IS_DISPLAYED} }})()", [css_selector], timeout=timeout)
+
+
+def wait_for_count(driver, css_selector, count, timeout=DEFAULT_TIMEOUT):
+    """Wait until exactly count elements match css_selector"""
+    return _observe(driver, "mutation", f"{count} elements matching '{css_selector}'",
+                    "return document.querySelectorAll(args[0]).length === args[1];",
+                    [css_selector, count], timeout=timeout)
+
+
+def wait_for_resize(driver, element, previous_size, timeout=DEFAULT_TIMEOUT):
+    """
+    Wait until element's rendered size differs from previous_size
+    (a WebElement.size dict) and return once it does.
+    """
+    return _observe(driver, "resize", f"element to resize from {previous_size['width']}x{previous_size['height']}",
+                    "const r = root.getBoundingClientRect();"
+                    "return Math.round(r.width) !== Math.round(args[0]) ||"
+                    " Math.round(r.height) !== Math.round(args[1]);",
+                    [previous_size["width"], previous_size["height"]], root=element, timeout=timeout)
+
@@ -1,85 +1,178 @@
 import pytest
 import os
-import allure
-from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-import random
+from functools import partial
+from browser.factory import (
+    DEFAULT_PROFILE, DOWNLOADS_DIR, IMPLICIT_WAIT, PROFILE_PERMISSIONS, create_chrome_driver
+)
+from browser.pool import DriverPool, ProfilePools
+from browser.contexts import IsolatedContext
+from browser.downloads import DownloadManager
+from browser.environment import browser_info, merge_environment, write_worker_environment
+from browser.lazy import LazyDriver
+from browser.screenshots import ScreenshotCapture
 
-@pytest.fixture(scope="function")
-def driver():
+SCREENSHOTS = pytest.StashKey()
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "driver_profile(name, implicit_wait=None): launch profile for the driver fixture "
+        "(lean, downloads, geolocation) and optional implicit wait override"
+    )
+    config.stash[SCREENSHOTS] = ScreenshotCapture(
+        image_format=os.getenv('SCREENSHOT_FORMAT', 'png').lower(),
+        quality=int(os.getenv('SCREENSHOT_QUALITY', '80'))
+    )
+
+def use_driver_pool():
+    return os.getenv('CHROME_POOL', 'false').lower() == 'true'
+
+def use_browser_contexts():
+    return os.getenv('CHROME_CONTEXTS', 'false').lower() == 'true'
+
+@pytest.fixture(scope="session")
+def download_dir():
+    """Per-worker download directory, so parallel workers never share files"""
+    path = os.path.join(DOWNLOADS_DIR, os.getenv('PYTEST_XDIST_WORKER', 'master'))
+    os.makedirs(path, exist_ok=True)
+    return path
+
+@pytest.fixture(scope="session")
+def driver_pools(download_dir):
     """
-    Fixture to provide a configured Chrome WebDriver instance.
-    Handles both local development and CI/CD environments.
+    Session-scoped pools of warm Chrome instances, one pool per launch profile
+    (and per xdist worker). Enabled with CHROME_POOL=true or CHROME_CONTEXTS=true;
+    otherwise every test launches its own browser.
     """
-    # Set up Chrome options
-    chrome_options = Options()
+    if not (use_driver_pool() or use_browser_contexts()):
+        yield None
+        return
     
-    # Only add user data directory if explicitly set (CI environment)
-    chrome_user_data_dir = os.getenv('CHROME_USER_DATA_DIR')
-    if chrome_user_data_dir:
-        chrome_options.add_argument(f"--user-data-dir={chrome_user_data_dir}")
+    def make_pool(profile):
+        return DriverPool(
+            partial(create_chrome_driver, profile, download_dir),
+            size=int(os.getenv('CHROME_POOL_SIZE', '1')),
+            max_leases=int(os.getenv('CHROME_POOL_MAX_LEASES', '25')),
+            implicit_wait=IMPLICIT_WAIT,
+            download_dir=download_dir
+        )
+    
+    # Warm up the default profile right away, the others on first use
+    pools = ProfilePools(make_pool, warm=[DEFAULT_PROFILE])
+    yield pools
+    pools.close()
+
+def allure_results_dir(config):
+    """The --alluredir of this run (falls back to ./allure-results)"""
+    return config.getoption("allure_report_dir", None) or "allure-results"
+
+@pytest.fixture(scope="session")
+def record_environment(request):
+    """
+    Record browser environment info for Allure once per worker, from the
+    first browser that actually starts. The workers' files are merged into
+    environment.properties when the session finishes.
+    """
+    results_dir = allure_results_dir(request.config)
+    worker_id = os.getenv('PYTEST_XDIST_WORKER', 'master')
+    recorded = []
     
-    # Check if running in headless environment (GitHub Actions)
-    if os.getenv('CHROME_HEADLESS', 'false').lower() == 'true':
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-plugins")
-    else:
-        # Local development - maximize window
-        chrome_options.add_argument("--start-maximized")
+    def record(driver):
+        if recorded:
+            return
+        recorded.append(True)
+        try:
+            write_worker_environment(results_dir, worker_id, browser_info(driver))
+        except Exception as e:
+            print(f"❌ Failed to add environment info: {e}")
     
-    # Additional options for stability
-    chrome_options.add_argument("--disable-web-security")
-    chrome_options.add_argument("--allow-running-insecure-content")
+    return record
+
+def pytest_sessionfinish(session):
+    # Workers only write their own file; the controller merges them
+    if not hasattr(session.config, "workerinput"):
+        merge_environment(allure_results_dir(session.config))
+
+@pytest.fixture(scope="function")
+def driver(request, driver_pools, download_dir, record_environment):
+    """
+    Fixture to provide a configured Chrome WebDriver instance.
     
-    # Parallel execution improvements
-    debug_port = random.randint(9222, 9299)
-    chrome_options.add_argument(f"--remote-debugging-port={debug_port}")
-    chrome_options.add_argument("--disable-background-timer-throttling")
-    chrome_options.add_argument("--disable-backgrounding-occluded-windows")
-    chrome_options.add_argument("--disable-renderer-backgrounding")
+    Test classes pick a launch profile declaratively:
+        @pytest.mark.driver_profile("downloads")
     
-    # Cache clearing options for CI/CD
-    chrome_options.add_argument("--disable-application-cache")
-    chrome_options.add_argument("--disable-cache")
-    chrome_options.add_argument("--disable-offline-load-stale-cache")
-    chrome_options.add_argument("--disk-cache-size=0")
-    chrome_options.add_argument("--media-cache-size=0")
+    The browser is only started (or leased from the pool) when the test
+    issues its first command, so tests that never touch it cost nothing.
     
-    # Set user agent
-    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    Leases a browser from the pool when pooling is enabled. With
+    CHROME_CONTEXTS=true the test runs in a fresh incognito-style browser
+    context inside the leased browser instead of a clean process.
+    """
+    marker = request.node.get_closest_marker("driver_profile")
+    profile = marker.args[0] if marker and marker.args else DEFAULT_PROFILE
+    implicit_wait = marker.kwargs.get("implicit_wait") if marker else None
+    lease = {}
     
-    try:
-        # Use webdriver-manager for automatic driver management
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-    except Exception as e:
-        print(f"WebDriver Manager failed: {e}")
-        try:
-            # Fallback to system ChromeDriver
-            driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e2:
-            print(f"System ChromeDriver failed: {e2}")
-            # Last resort - try without service
-            driver = webdriver.Chrome(options=chrome_options)
+    def start():
+        if driver_pools is None:
+            real_driver = create_chrome_driver(profile, download_dir)
+        else:
+            pool = driver_pools.get(profile)
+            real_driver = pool.acquire()
+            lease["pool"] = pool
+            if use_browser_contexts():
+                context = IsolatedContext(
+                    real_driver,
+                    permissions=PROFILE_PERMISSIONS.get(profile, ()),
+                    download_dir=download_dir
+                )
+                try:
+                    context.open()
+                except Exception:
+                    pool.release(real_driver)
+                    lease.clear()
+                    raise
+                lease["context"] = context
+        
+        if implicit_wait is not None:
+            real_driver.implicitly_wait(implicit_wait)
+        record_environment(real_driver)
+        return real_driver
     
-    # Set implicit wait
-    driver.implicitly_wait(10)
+    driver = LazyDriver(start)
     
     yield driver
     
-    # Clean up
+    if not driver.started:
+        return
+    real_driver = driver.wrapped
+    
+    if "pool" not in lease:
+        # Clean up
+        try:
+            real_driver.quit()
+        except Exception:
+            pass
+        return
+    
+    context = lease.get("context")
     try:
-        driver.quit()
-    except Exception:
-        pass
+        if context:
+            context.close()
+    finally:
+        lease["pool"].release(real_driver, reset=context is None)
+
+@pytest.fixture(scope="function")
+def downloads(driver, download_dir):
+    """
+    Watches the test's browser downloads into this worker's download
+    directory and deletes the downloaded files afterwards:
+        with downloads.expect_download() as download:
+            button.click()
+    """
+    manager = DownloadManager(driver, download_dir)
+    yield manager
+    manager.close()
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
@@ -94,54 +187,15 @@ def pytest_runtest_makereport(item, call):
         try:
             # Get the driver from the test
             driver = item.funcargs.get("driver")
-            if driver:
-                # Create screenshots directory if it doesn't exist
-                screenshots_dir = "allure-results/screenshots"
-                os.makedirs(screenshots_dir, exist_ok=True)
-                
-                # Generate unique filename
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            # Never launch a browser just to photograph an empty page
+            if driver and getattr(driver, "started", True):
+                screenshots = item.config.stash[SCREENSHOTS]
                 test_name = item.name.replace("/", "_").replace("\\", "_")
-                screenshot_path = f"{screenshots_dir}/{test_name}_{timestamp}.png"
                 
-                # Take screenshot
-                driver.save_screenshot(screenshot_path)
+                # Take the screenshot in memory and attach it to the Allure report
+                screenshots.attach(test_name, screenshots.capture(driver))
                 
-                # Attach screenshot to Allure report
-                with open(screenshot_path, "rb") as f:
-                    allure.attach(
-                        f.read(),
-                        name=f"Screenshot - {test_name}",
-                        attachment_type=allure.attachment_type.PNG
-                    )
-                
-                print(f"📸 Screenshot saved: {screenshot_path}")
+                print(f"📸 Screenshot attached: {test_name}")
                 
         except Exception as e:
             print(f"❌ Failed to capture screenshot: {e}")
-
-@pytest.fixture(autouse=True)
-def allure_environment_info(driver):
-    """
-    Add environment information to Allure report
-    """
-    if driver:
-        try:
-            # Add browser info
-            browser_info = {
-                "Browser": driver.capabilities.get("browserName", "Unknown"),
-                "Browser Version": driver.capabilities.get("browserVersion", "Unknown"),
-                "Platform": driver.capabilities.get("platformName", "Unknown"),
-                "Headless": os.getenv('CHROME_HEADLESS', 'false').lower() == 'true'
-            }
-            
-            # Write environment info to allure-results
-            env_file = "allure-results/environment.properties"
-            os.makedirs("allure-results", exist_ok=True)
-            
-            with open(env_file, "w") as f:
-                for key, value in browser_info.items():
-                    f.write(f"{key}={value}\n")
-                    
-        except Exception as e:
-            print(f"❌ Failed to add environment info: {e}") 
\ No newline at end of file
@@ -1,46 +1,14 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import pytest
 import time
+from browser.routes import open_component
 
 class TestAccordion:
-    @pytest.fixture
-    def driver(self):
-        # Set up Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
-        
-        # Initialize the Chrome driver with automatic driver management
-        driver = webdriver.Chrome(options=chrome_options)
-        
-        yield driver
-        
-        # Clean up
-        driver.quit()
-
     def navigate_to_accordion_page(self, driver):
-        # Navigate to the page
-        driver.get("https://practiceautomatedtesting.com/webelements")
-        
-        # Click on Widgets menu
-        widgets_menu = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Widgets')]"))
-        )
-        widgets_menu.click()
-        
-        # Click on Accordion link
-        accordion_link = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Accordion')]"))
-        )
-        accordion_link.click()
-        
-        # Wait for the accordion component to be visible
-        WebDriverWait(driver, 10).until(
-            EC.visibility_of_element_located((By.TAG_NAME, "section"))
-        )
+        # Open the component (deep link, or through the sidebar menu)
+        open_component(driver, "Widgets", "Accordion", (By.TAG_NAME, "section"))
 
     def test_accordion_initial_state(self, driver):
         self.navigate_to_accordion_page(driver)
@@ -1,45 +1,13 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import pytest
+from browser.routes import open_component
 
 class TestBrokenLinks:
-    @pytest.fixture
-    def driver(self):
-        # Set up Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
-        
-        # Initialize the Chrome driver with automatic driver management
-        driver = webdriver.Chrome(options=chrome_options)
-        
-        yield driver
-        
-        # Clean up
-        driver.quit()
-
     def navigate_to_broken_links_page(self, driver):
-        # Navigate to the page
-        driver.get("https://practiceautomatedtesting.com/webelements")
-        
-        # Click on Elements menu
-        elements_menu = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Elements')]"))
-        )
-        elements_menu.click()
-        
-        # Click on Broken Links link
-        broken_links_link = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Broken Links')]"))
-        )
-        broken_links_link.click()
-        
-        # Wait for the broken links component to be visible
-        WebDriverWait(driver, 10).until(
-            EC.visibility_of_element_located((By.CSS_SELECTOR, "[class*='componentContainer']"))
-        )
+        # Open the component (deep link, or through the sidebar menu)
+        open_component(driver, "Elements", "Broken Links", (By.CSS_SELECTOR, "[class*='componentContainer']"))
 
     def test_broken_image(self, driver):
         self.navigate_to_broken_links_page(driver)
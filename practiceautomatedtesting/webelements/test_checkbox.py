@@ -4,28 +4,12 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, ElementNotInteractableException
 import pytest
 import allure
+from browser.routes import open_component
 
 class TestCheckbox:
     def navigate_to_checkbox_page(self, driver):
-        # Navigate to the page
-        driver.get("https://practiceautomatedtesting.com/webelements")
-        
-        # Click on Elements menu
-        elements_menu = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Elements')]"))
-        )
-        elements_menu.click()
-        
-        # Click on Check Box link
-        checkbox_link = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Check Box')]"))
-        )
-        checkbox_link.click()
-        
-        # Wait for the checkbox component to be visible
-        WebDriverWait(driver, 10).until(
-            EC.visibility_of_element_located((By.CSS_SELECTOR, "[class*='componentContainer']"))
-        )
+        # Open the component (deep link, or through the sidebar menu)
+        open_component(driver, "Elements", "Check Box", (By.CSS_SELECTOR, "[class*='componentContainer']"))
 
     @allure.feature("Checkbox Functionality")
     @allure.story("Label Click Interaction")
@@ -1,6 +1,3 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -10,53 +7,18 @@ import pytest
 from datetime import datetime
 import time
 import logging
+from browser.routes import open_component
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class TestDatepicker:
-    @pytest.fixture
-    def driver(self):
-        # Set up Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
-        
-        # Initialize the Chrome driver with automatic driver management
-        driver = webdriver.Chrome(options=chrome_options)
-        
-        yield driver
-        
-        # Clean up
-        driver.quit()
-
     def test_datepicker_interactions(self, driver):
         try:
-            # Navigate to the web elements page
-            logger.info("Navigating to the web elements page")
-            driver.get("https://practiceautomatedtesting.com/webelements")
-            
-            # Click on Widgets menu
-            logger.info("Looking for Widgets menu")
-            widgets_menu = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Widgets')]"))
-            )
-            widgets_menu.click()
-            logger.info("Clicked Widgets menu")
-            
-            # Click on Date Picker link
-            logger.info("Looking for Date Picker link")
-            datepicker_link = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Date Picker')]"))
-            )
-            datepicker_link.click()
-            logger.info("Clicked Date Picker link")
-            
-            # Wait for the datepicker component to be visible
-            logger.info("Waiting for datepicker component")
-            WebDriverWait(driver, 10).until(
-                EC.visibility_of_element_located((By.CSS_SELECTOR, "[class*='componentContainer']"))
-            )
+            # Open the Date Picker component (deep link, or through the sidebar menu)
+            logger.info("Opening the Date Picker component")
+            open_component(driver, "Widgets", "Date Picker", (By.CSS_SELECTOR, "[class*='componentContainer']"))
             
             # Find the date input element
             logger.info("Looking for date input element")
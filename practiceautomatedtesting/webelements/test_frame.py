@@ -1,45 +1,13 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import pytest
+from browser.routes import open_component
 
 class TestFrame:
-    @pytest.fixture
-    def driver(self):
-        # Set up Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
-        
-        # Initialize the Chrome driver with automatic driver management
-        driver = webdriver.Chrome(options=chrome_options)
-        
-        yield driver
-        
-        # Clean up
-        driver.quit()
-
     def navigate_to_frame_page(self, driver):
-        # Navigate to the page
-        driver.get("https://practiceautomatedtesting.com/webelements")
-        
-        # Click on Interactions menu
-        interactions_menu = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Interactions')]"))
-        )
-        interactions_menu.click()
-        
-        # Click on Frame link
-        frame_link = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Frame')]"))
-        )
-        frame_link.click()
-        
-        # Wait for the frame container to be visible
-        WebDriverWait(driver, 10).until(
-            EC.visibility_of_element_located((By.XPATH, "//div[contains(., 'Nested Frames Example')]"))
-        )
+        # Open the component (deep link, or through the sidebar menu)
+        open_component(driver, "Interactions", "Frame", (By.XPATH, "//div[contains(., 'Nested Frames Example')]"))
 
     def get_frame(self, driver, title):
         # Switch to the frame by title
@@ -1,54 +1,15 @@
 import pytest
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-import time
+from browser.routes import open_component
 
+@pytest.mark.driver_profile("geolocation")
 class TestGeolocation:
-    @pytest.fixture(scope="function")
-    def driver(self):
-        # Set up Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
-        # Add geolocation permissions
-        chrome_options.add_experimental_option("prefs", {
-            "profile.default_content_setting_values.geolocation": 1  # 1:allow, 2:block
-        })
-        
-        # Initialize the Chrome driver
-        driver = webdriver.Chrome(options=chrome_options)
-        yield driver
-        driver.quit()
-
     def test_get_current_location_mocked(self, driver):
-        # Navigate to the web elements page
-        print("Navigating to website...")
-        driver.get("https://practiceautomatedtesting.com/webelements")
-        
-        # Wait for page to load completely
-        print("Waiting for page to load...")
-        WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        # Give extra time for JavaScript to initialize
-        time.sleep(2)
-        
-        # Click on Interactions menu
-        print("Looking for Interactions menu...")
-        interactions_menu = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Interactions')]"))
-        )
-        interactions_menu.click()
-        
-        # Click on Geolocation link
-        print("Looking for Geolocation link...")
-        geolocation_link = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Geolocation')]"))
-        )
-        geolocation_link.click()
+        # Open the Geolocation component (deep link, or through the sidebar menu)
+        print("Opening Geolocation...")
+        open_component(driver, "Interactions", "Geolocation", (By.XPATH, "//button[contains(text(), 'Get My Location')]"))
         
         # Set mock geolocation using JavaScript
         print("Setting mock geolocation...")
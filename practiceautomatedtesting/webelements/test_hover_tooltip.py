@@ -1,66 +1,24 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.actions.action_builder import ActionBuilder
 import pytest
-import time
+from browser.routes import open_component
+from browser.waits import wait_until_displayed, wait_until_hidden
 
-class TestHoverTooltip:
-    @pytest.fixture
-    def driver(self):
-        # Set up Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
-        
-        # Initialize the Chrome driver with automatic driver management
-        driver = webdriver.Chrome(options=chrome_options)
-        
-        yield driver
-        
-        # Clean up
-        driver.quit()
+def move_mouse_away(driver):
+    # Park the pointer in the top-left corner of the viewport, off the button
+    builder = ActionBuilder(driver)
+    builder.pointer_action.move_to_location(0, 0)
+    builder.perform()
 
+
+# Absence checks below rely on find_element failing fast
+@pytest.mark.driver_profile("lean", implicit_wait=0)
+class TestHoverTooltip:
     def test_tooltip_initial_state(self, driver):
-        # Navigate to the page
-        driver.get("https://practiceautomatedtesting.com/webelements")
-        print("Navigated to page")
-        
-        # Click on Widgets menu
-        try:
-            widgets_menu = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Widgets')]"))
-            )
-            print("Found Widgets menu")
-            widgets_menu.click()
-            print("Clicked Widgets menu")
-        except Exception as e:
-            print(f"Error clicking Widgets menu: {str(e)}")
-            raise
-        
-        # Click on Hover and Tooltip link
-        try:
-            tooltip_link = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Hover and Tooltip')]"))
-            )
-            print("Found Hover and Tooltip link")
-            tooltip_link.click()
-            print("Clicked Hover and Tooltip link")
-        except Exception as e:
-            print(f"Error clicking Hover and Tooltip link: {str(e)}")
-            raise
-        
-        # Wait for the component to be visible
-        try:
-            WebDriverWait(driver, 10).until(
-                EC.visibility_of_element_located((By.CSS_SELECTOR, "[class*='WebElements_formSection']"))
-            )
-            print("Found form section")
-        except Exception as e:
-            print(f"Error finding form section: {str(e)}")
-            raise
+        # Open the Hover and Tooltip component (deep link, or through the sidebar menu)
+        open_component(driver, "Widgets", "Hover and Tooltip", (By.CSS_SELECTOR, "[class*='WebElements_formSection']"))
+        print("Opened Hover and Tooltip")
         
         # Get the hover button
         try:
@@ -87,43 +45,9 @@ class TestHoverTooltip:
             pass
 
     def test_tooltip_appears_on_hover(self, driver):
-        # Navigate to the page
-        driver.get("https://practiceautomatedtesting.com/webelements")
-        print("Navigated to page")
-        
-        # Click on Widgets menu
-        try:
-            widgets_menu = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Widgets')]"))
-            )
-            print("Found Widgets menu")
-            widgets_menu.click()
-            print("Clicked Widgets menu")
-        except Exception as e:
-            print(f"Error clicking Widgets menu: {str(e)}")
-            raise
-        
-        # Click on Hover and Tooltip link
-        try:
-            tooltip_link = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Hover and Tooltip')]"))
-            )
-            print("Found Hover and Tooltip link")
-            tooltip_link.click()
-            print("Clicked Hover and Tooltip link")
-        except Exception as e:
-            print(f"Error clicking Hover and Tooltip link: {str(e)}")
-            raise
-        
-        # Wait for the component to be visible
-        try:
-            WebDriverWait(driver, 10).until(
-                EC.visibility_of_element_located((By.CSS_SELECTOR, "[class*='WebElements_formSection']"))
-            )
-            print("Found form section")
-        except Exception as e:
-            print(f"Error finding form section: {str(e)}")
-            raise
+        # Open the Hover and Tooltip component (deep link, or through the sidebar menu)
+        open_component(driver, "Widgets", "Hover and Tooltip", (By.CSS_SELECTOR, "[class*='WebElements_formSection']"))
+        print("Opened Hover and Tooltip")
         
         # Get the hover button
         try:
@@ -142,7 +66,7 @@ class TestHoverTooltip:
         try:
             actions.move_to_element(hover_button).perform()
             print("Hovered over button")
-            time.sleep(1)  # Give a small delay for the tooltip to appear
+            wait_until_displayed(driver, "#custom-tooltip")
         except Exception as e:
             print(f"Error hovering over button: {str(e)}")
             raise
@@ -158,43 +82,9 @@ class TestHoverTooltip:
             raise
 
     def test_tooltip_disappears_on_mouse_leave(self, driver):
-        # Navigate to the page
-        driver.get("https://practiceautomatedtesting.com/webelements")
-        print("Navigated to page")
-        
-        # Click on Widgets menu
-        try:
-            widgets_menu = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Widgets')]"))
-            )
-            print("Found Widgets menu")
-            widgets_menu.click()
-            print("Clicked Widgets menu")
-        except Exception as e:
-            print(f"Error clicking Widgets menu: {str(e)}")
-            raise
-        
-        # Click on Hover and Tooltip link
-        try:
-            tooltip_link = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Hover and Tooltip')]"))
-            )
-            print("Found Hover and Tooltip link")
-            tooltip_link.click()
-            print("Clicked Hover and Tooltip link")
-        except Exception as e:
-            print(f"Error clicking Hover and Tooltip link: {str(e)}")
-            raise
-        
-        # Wait for the component to be visible
-        try:
-            WebDriverWait(driver, 10).until(
-                EC.visibility_of_element_located((By.CSS_SELECTOR, "[class*='WebElements_formSection']"))
-            )
-            print("Found form section")
-        except Exception as e:
-            print(f"Error finding form section: {str(e)}")
-            raise
+        # Open the Hover and Tooltip component (deep link, or through the sidebar menu)
+        open_component(driver, "Widgets", "Hover and Tooltip", (By.CSS_SELECTOR, "[class*='WebElements_formSection']"))
+        print("Opened Hover and Tooltip")
         
         # Get the hover button
         try:
@@ -213,7 +103,7 @@ class TestHoverTooltip:
         try:
             actions.move_to_element(hover_button).perform()
             print("Hovered over button")
-            time.sleep(1)  # Give a small delay for the tooltip to appear
+            wait_until_displayed(driver, "#custom-tooltip")
         except Exception as e:
             print(f"Error hovering over button: {str(e)}")
             raise
@@ -230,15 +120,15 @@ class TestHoverTooltip:
         
         # Move mouse away
         try:
-            actions.move_by_offset(0, 0).perform()
+            move_mouse_away(driver)
             print("Moved mouse away")
-            time.sleep(1)  # Give a small delay for the tooltip to disappear
         except Exception as e:
             print(f"Error moving mouse away: {str(e)}")
             raise
         
         # Verify tooltip is not visible
         try:
+            wait_until_hidden(driver, "#custom-tooltip", timeout=2)
             tooltip = driver.find_element(By.ID, "custom-tooltip")
             print(f"Tooltip still displayed: {tooltip.is_displayed()}")
             assert not tooltip.is_displayed()
@@ -248,43 +138,9 @@ class TestHoverTooltip:
             pass
 
     def test_multiple_hover_interactions(self, driver):
-        # Navigate to the page
-        driver.get("https://practiceautomatedtesting.com/webelements")
-        print("Navigated to page")
-        
-        # Click on Widgets menu
-        try:
-            widgets_menu = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Widgets')]"))
-            )
-            print("Found Widgets menu")
-            widgets_menu.click()
-            print("Clicked Widgets menu")
-        except Exception as e:
-            print(f"Error clicking Widgets menu: {str(e)}")
-            raise
-        
-        # Click on Hover and Tooltip link
-        try:
-            tooltip_link = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Hover and Tooltip')]"))
-            )
-            print("Found Hover and Tooltip link")
-            tooltip_link.click()
-            print("Clicked Hover and Tooltip link")
-        except Exception as e:
-            print(f"Error clicking Hover and Tooltip link: {str(e)}")
-            raise
-        
-        # Wait for the component to be visible
-        try:
-            WebDriverWait(driver, 10).until(
-                EC.visibility_of_element_located((By.CSS_SELECTOR, "[class*='WebElements_formSection']"))
-            )
-            print("Found form section")
-        except Exception as e:
-            print(f"Error finding form section: {str(e)}")
-            raise
+        # Open the Hover and Tooltip component (deep link, or through the sidebar menu)
+        open_component(driver, "Widgets", "Hover and Tooltip", (By.CSS_SELECTOR, "[class*='WebElements_formSection']"))
+        print("Opened Hover and Tooltip")
         
         # Get the hover button
         try:
@@ -306,7 +162,7 @@ class TestHoverTooltip:
             try:
                 actions.move_to_element(hover_button).perform()
                 print("Hovered over button")
-                time.sleep(1)  # Give a small delay for the tooltip to appear
+                wait_until_displayed(driver, "#custom-tooltip")
             except Exception as e:
                 print(f"Error hovering over button: {str(e)}")
                 raise
@@ -323,15 +179,15 @@ class TestHoverTooltip:
             
             # Move mouse away
             try:
-                actions.move_by_offset(0, 0).perform()
+                move_mouse_away(driver)
                 print("Moved mouse away")
-                time.sleep(1)  # Give a small delay for the tooltip to disappear
             except Exception as e:
                 print(f"Error moving mouse away: {str(e)}")
                 raise
             
             # Verify tooltip is not visible
             try:
+                wait_until_hidden(driver, "#custom-tooltip", timeout=2)
                 tooltip = driver.find_element(By.ID, "custom-tooltip")
                 print(f"Tooltip still displayed: {tooltip.is_displayed()}")
                 assert not tooltip.is_displayed()
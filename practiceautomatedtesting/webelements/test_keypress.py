@@ -1,46 +1,14 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import pytest
+from browser.routes import open_component
 
 class TestKeypress:
-    @pytest.fixture
-    def driver(self):
-        # Set up Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
-        
-        # Initialize the Chrome driver with automatic driver management
-        driver = webdriver.Chrome(options=chrome_options)
-        
-        yield driver
-        
-        # Clean up
-        driver.quit()
-
     def navigate_to_keypress_page(self, driver):
-        # Navigate to the page
-        driver.get("https://practiceautomatedtesting.com/webelements")
-        
-        # Click on Interactions menu
-        interactions_menu = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Interactions')]"))
-        )
-        interactions_menu.click()
-        
-        # Click on Keypress link
-        keypress_link = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Keypress')]"))
-        )
-        keypress_link.click()
-        
-        # Wait for the keypress container to be visible
-        WebDriverWait(driver, 10).until(
-            EC.visibility_of_element_located((By.CLASS_NAME, "KeyPresses_container__IvRHJ"))
-        )
+        # Open the component (deep link, or through the sidebar menu)
+        open_component(driver, "Interactions", "Keypress", (By.CLASS_NAME, "KeyPresses_container__IvRHJ"))
 
     def test_single_key_press(self, driver):
         self.navigate_to_keypress_page(driver)
@@ -1,45 +1,13 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import pytest
+from browser.routes import open_component
 
 class TestLinks:
-    @pytest.fixture
-    def driver(self):
-        # Set up Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
-        
-        # Initialize the Chrome driver with automatic driver management
-        driver = webdriver.Chrome(options=chrome_options)
-        
-        yield driver
-        
-        # Clean up
-        driver.quit()
-
     def navigate_to_links_page(self, driver):
-        # Navigate to the page
-        driver.get("https://practiceautomatedtesting.com/webelements")
-        
-        # Click on Elements menu
-        elements_menu = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Elements')]"))
-        )
-        elements_menu.click()
-        
-        # Click on Links link
-        links_link = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Links')]"))
-        )
-        links_link.click()
-        
-        # Wait for the links component to be visible
-        WebDriverWait(driver, 10).until(
-            EC.visibility_of_element_located((By.CSS_SELECTOR, "[class*='componentContainer']"))
-        )
+        # Open the component (deep link, or through the sidebar menu)
+        open_component(driver, "Elements", "Links", (By.CSS_SELECTOR, "[class*='componentContainer']"))
 
     def test_analyze_page_structure(self, driver):
         self.navigate_to_links_page(driver)
@@ -103,7 +71,6 @@ class TestLinks:
         )
         home_link.click()
         WebDriverWait(driver, 10).until(EC.url_to_be("https://practiceautomatedtesting.com/"))
-        driver.get("https://practiceautomatedtesting.com/webelements")
         self.navigate_to_links_page(driver)
         
         # Test Checkboxes link response
@@ -112,7 +79,6 @@ class TestLinks:
         )
         checkboxes_link.click()
         WebDriverWait(driver, 10).until(EC.url_to_be("https://practiceautomatedtesting.com/webelements/checkboxes"))
-        driver.get("https://practiceautomatedtesting.com/webelements")
         self.navigate_to_links_page(driver)
         
         # Test Non-existent Page link response
@@ -137,7 +103,6 @@ class TestLinks:
         assert error_message.is_displayed()
         assert error_description.is_displayed()
         
-        driver.get("https://practiceautomatedtesting.com/webelements")
         self.navigate_to_links_page(driver)
         
         # Test Invalid Path link response
@@ -162,7 +127,6 @@ class TestLinks:
         assert error_message.is_displayed()
         assert error_description.is_displayed()
         
-        driver.get("https://practiceautomatedtesting.com/webelements")
         self.navigate_to_links_page(driver)
         
         # Test 404 Page link response
@@ -1,41 +1,13 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import pytest
+from browser.routes import open_component
 
 class TestModal:
-    @pytest.fixture
-    def driver(self):
-        # Set up Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
-        
-        # Initialize the Chrome driver with automatic driver management
-        driver = webdriver.Chrome(options=chrome_options)
-        
-        yield driver
-        
-        # Clean up
-        driver.quit()
-
     def test_open_modal(self, driver):
-        # Navigate to the page
-        driver.get("https://practiceautomatedtesting.com/webelements")
-        
-        # Click on Interactions menu
-        interactions_menu = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Interactions')]"))
-        )
-        interactions_menu.click()
-        
-        # Click on Modal link
-        modal_link = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Modal')]"))
-        )
-        modal_link.click()
+        # Open the component (deep link, or through the sidebar menu)
+        open_component(driver, "Interactions", "Modal", (By.XPATH, "//p[contains(., 'Work Instruction:')]"))
         
         # Verify work instruction is visible
         work_instruction = WebDriverWait(driver, 10).until(
@@ -61,20 +33,8 @@ class TestModal:
         assert modal_content.is_displayed()
 
     def test_modal_content(self, driver):
-        # Navigate to the page
-        driver.get("https://practiceautomatedtesting.com/webelements")
-        
-        # Click on Interactions menu
-        interactions_menu = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Interactions')]"))
-        )
-        interactions_menu.click()
-        
-        # Click on Modal link
-        modal_link = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Modal')]"))
-        )
-        modal_link.click()
+        # Open the component (deep link, or through the sidebar menu)
+        open_component(driver, "Interactions", "Modal", (By.XPATH, "//p[contains(., 'Work Instruction:')]"))
         
         # Click open modal button
         open_button = WebDriverWait(driver, 10).until(
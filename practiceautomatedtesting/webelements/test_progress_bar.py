@@ -1,46 +1,14 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import pytest
 import time
+from browser.routes import open_component
 
 class TestProgressBar:
-    @pytest.fixture
-    def driver(self):
-        # Set up Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
-        
-        # Initialize the Chrome driver with automatic driver management
-        driver = webdriver.Chrome(options=chrome_options)
-        
-        yield driver
-        
-        # Clean up
-        driver.quit()
-
     def navigate_to_progress_bar_page(self, driver):
-        # Navigate to the page
-        driver.get("https://practiceautomatedtesting.com/webelements")
-        
-        # Click on Widgets menu
-        widgets_menu = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Widgets')]"))
-        )
-        widgets_menu.click()
-        
-        # Click on Progress Bar link
-        progress_bar_link = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Progress Bar')]"))
-        )
-        progress_bar_link.click()
-        
-        # Wait for the progress bar to be visible
-        WebDriverWait(driver, 10).until(
-            EC.visibility_of_element_located((By.CSS_SELECTOR, "[class*='WebElements_formSection']"))
-        )
+        # Open the component (deep link, or through the sidebar menu)
+        open_component(driver, "Widgets", "Progress Bar", (By.CSS_SELECTOR, "[class*='WebElements_formSection']"))
 
     def get_start_button(self, driver):
         return WebDriverWait(driver, 10).until(
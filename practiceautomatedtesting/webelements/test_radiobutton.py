@@ -2,28 +2,12 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import pytest
+from browser.routes import open_component
 
 class TestRadioButton:
     def navigate_to_radio_page(self, driver):
-        # Navigate to the page
-        driver.get("https://practiceautomatedtesting.com/webelements")
-        
-        # Click on Elements menu
-        elements_menu = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Elements')]"))
-        )
-        elements_menu.click()
-        
-        # Click on Radio Button link
-        radio_link = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Radio Button')]"))
-        )
-        radio_link.click()
-        
-        # Wait for the radio button container to be visible
-        WebDriverWait(driver, 10).until(
-            EC.visibility_of_element_located((By.CSS_SELECTOR, "[class*='componentContainer']"))
-        )
+        # Open the component (deep link, or through the sidebar menu)
+        open_component(driver, "Elements", "Radio Button", (By.CSS_SELECTOR, "[class*='componentContainer']"))
 
     def test_radio_button_selection(self, driver):
         self.navigate_to_radio_page(driver)
@@ -1,47 +1,15 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 import pytest
-import time
+from browser.routes import open_component
+from browser.waits import wait_for_resize
 
 class TestResize:
-    @pytest.fixture
-    def driver(self):
-        # Set up Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
-        
-        # Initialize the Chrome driver with automatic driver management
-        driver = webdriver.Chrome(options=chrome_options)
-        
-        yield driver
-        
-        # Clean up
-        driver.quit()
-
     def navigate_to_resize_page(self, driver):
-        # Navigate to the page
-        driver.get("https://practiceautomatedtesting.com/webelements")
-        
-        # Click on Interactions menu
-        interactions_menu = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Interactions')]"))
-        )
-        interactions_menu.click()
-        
-        # Click on Resize link
-        resize_link = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Resize')]"))
-        )
-        resize_link.click()
-        
-        # Wait for the resize container to be visible
-        WebDriverWait(driver, 10).until(
-            EC.visibility_of_element_located((By.CSS_SELECTOR, "div[style*='background: rgb(227, 242, 253)']"))
-        )
+        # Open the component (deep link, or through the sidebar menu)
+        open_component(driver, "Interactions", "Resize", (By.CSS_SELECTOR, "div[style*='background: rgb(227, 242, 253)']"))
 
     def test_resize_initial_state(self, driver):
         self.navigate_to_resize_page(driver)
@@ -81,7 +49,7 @@ class TestResize:
         actions.perform()
         
         # Wait for resize to complete
-        time.sleep(0.1)
+        wait_for_resize(driver, resizable_element, initial_size)
         
         # Verify new dimensions
         new_size = resizable_element.size
@@ -111,7 +79,7 @@ class TestResize:
         actions.perform()
         
         # Wait for resize to complete
-        time.sleep(0.1)
+        wait_for_resize(driver, resizable_element, initial_size)
         
         # Verify new dimensions
         new_size = resizable_element.size
@@ -142,7 +110,7 @@ class TestResize:
         actions.perform()
         
         # Wait for resize to complete
-        time.sleep(0.1)
+        wait_for_resize(driver, resizable_element, initial_size)
         
         # Verify new dimensions
         new_size = resizable_element.size
@@ -160,6 +128,7 @@ class TestResize:
         resize_handle = driver.find_element(By.CSS_SELECTOR, "div[title='Resize']")
         
         # Try to resize beyond maximum (500x500)
+        size_before = resizable_element.size
         actions = ActionChains(driver)
         actions.move_to_element(resize_handle)
         actions.click_and_hold()
@@ -168,7 +137,7 @@ class TestResize:
         actions.perform()
         
         # Wait for resize to complete
-        time.sleep(0.1)
+        wait_for_resize(driver, resizable_element, size_before)
         
         # Verify dimensions are within maximum limits
         max_size = resizable_element.size
@@ -176,6 +145,7 @@ class TestResize:
         assert max_size['height'] <= 504
         
         # Try to resize below minimum (100x100)
+        size_before = resizable_element.size
         actions = ActionChains(driver)
         actions.move_to_element(resize_handle)
         actions.click_and_hold()
@@ -184,7 +154,7 @@ class TestResize:
         actions.perform()
         
         # Wait for resize to complete
-        time.sleep(0.1)
+        wait_for_resize(driver, resizable_element, size_before)
         
         # Verify dimensions are within minimum limits
         min_size = resizable_element.size
@@ -1,46 +1,14 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
 import pytest
+from browser.routes import open_component
 
 class TestSelectBox:
-    @pytest.fixture
-    def driver(self):
-        # Set up Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
-        
-        # Initialize the Chrome driver with automatic driver management
-        driver = webdriver.Chrome(options=chrome_options)
-        
-        yield driver
-        
-        # Clean up
-        driver.quit()
-
     def navigate_to_select_box_page(self, driver):
-        # Navigate to the page
-        driver.get("https://practiceautomatedtesting.com/webelements")
-        
-        # Click on Elements menu
-        elements_menu = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Elements')]"))
-        )
-        elements_menu.click()
-        
-        # Click on Select Box link
-        select_box_link = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Select Box')]"))
-        )
-        select_box_link.click()
-        
-        # Wait for the select box container to be visible
-        WebDriverWait(driver, 10).until(
-            EC.visibility_of_element_located((By.CSS_SELECTOR, "[class*='componentContainer']"))
-        )
+        # Open the component (deep link, or through the sidebar menu)
+        open_component(driver, "Elements", "Select Box", (By.CSS_SELECTOR, "[class*='componentContainer']"))
 
     def test_select_box_interactions(self, driver):
         self.navigate_to_select_box_page(driver)
@@ -1,42 +1,14 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 import pytest
+from browser.routes import open_component
 
 class TestSlider:
-    @pytest.fixture
-    def driver(self):
-        # Set up Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
-        
-        # Initialize the Chrome driver with automatic driver management
-        driver = webdriver.Chrome(options=chrome_options)
-        
-        yield driver
-        
-        # Clean up
-        driver.quit()
-
     def test_slider_interaction(self, driver):
-        # Navigate to the page
-        driver.get("https://practiceautomatedtesting.com/webelements")
-        
-        # Click on Widgets menu
-        widgets_menu = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Widgets')]"))
-        )
-        widgets_menu.click()
-        
-        # Click on Slider link
-        slider_link = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Slider')]"))
-        )
-        slider_link.click()
+        # Open the component (deep link, or through the sidebar menu)
+        open_component(driver, "Widgets", "Slider", (By.CSS_SELECTOR, "input[type='range']"))
         
         # Wait for the slider component to be visible
         slider = WebDriverWait(driver, 10).until(
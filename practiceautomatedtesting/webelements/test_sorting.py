@@ -1,61 +1,24 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import StaleElementReferenceException
 import pytest
-import time
+from browser.routes import open_component
+from browser.waits import wait_for_condition
 
 class TestSorting:
-    @pytest.fixture
-    def driver(self):
-        # Set up Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
-        
-        # Initialize the Chrome driver with automatic driver management
-        driver = webdriver.Chrome(options=chrome_options)
-        
-        yield driver
-        
-        # Clean up
-        driver.quit()
-
     @pytest.fixture(autouse=True)
     def setup(self, driver):
-        # Navigate to the web elements page
-        driver.get("https://practiceautomatedtesting.com/webelements")
-        
-        # Click the Interactions accordion in the sidebar
-        interactions_menu = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Interactions')]"))
-        )
-        interactions_menu.click()
-        
-        # Click the Sorting link in the sidebar
-        sorting_link = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Sorting')]"))
-        )
-        sorting_link.click()
-        
-        # Wait for the component to be visible
-        WebDriverWait(driver, 10).until(
-            EC.visibility_of_element_located((By.TAG_NAME, "section"))
-        )
+        # Open the component (deep link, or through the sidebar menu)
+        open_component(driver, "Interactions", "Sorting", (By.TAG_NAME, "section"))
 
     def wait_for_table_update(self, driver, expected_first_item):
-        def table_updated(driver):
-            try:
-                table_rows = driver.find_elements(By.CSS_SELECTOR, "section > div:nth-child(n+2)")
-                if not table_rows:
-                    return False
-                first_item = table_rows[0].find_element(By.CSS_SELECTOR, "div:first-child").text
-                return first_item == expected_first_item
-            except StaleElementReferenceException:
-                return False
-
-        WebDriverWait(driver, 10).until(table_updated)
+        # Resolves on the re-render that puts expected_first_item on top
+        wait_for_condition(
+            driver,
+            "const row = document.querySelector('section > div:nth-child(n+2)');"
+            "const cell = row && row.querySelector('div:first-child');"
+            "return cell !== null && cell.innerText.trim() === args[0];",
+            expected_first_item,
+            description=f"'{expected_first_item}' to be the first row"
+        )
 
     def test_initial_table_state(self, driver):
         # Get all table rows (excluding header)
@@ -136,22 +99,24 @@ class TestSorting:
             {"name": "Fennel", "price": "$1.29", "category": "Vegetable"}
         ]
 
-        # Sort by each column
+        # Sort by each column, with the row each click puts on top
         headers = [
-            driver.find_element(By.CSS_SELECTOR, "section > div:first-child > div:first-child"),  # Name
-            driver.find_element(By.CSS_SELECTOR, "section > div:first-child > div:nth-child(2)"),  # Price
-            driver.find_element(By.CSS_SELECTOR, "section > div:first-child > div:nth-child(3)")   # Category
+            (driver.find_element(By.CSS_SELECTOR, "section > div:first-child > div:first-child"), "Fennel", "Apple"),  # Name
+            (driver.find_element(By.CSS_SELECTOR, "section > div:first-child > div:nth-child(2)"), "Carrot", "Dragon Fruit"),  # Price
+            (driver.find_element(By.CSS_SELECTOR, "section > div:first-child > div:nth-child(3)"), "Apple", "Carrot")   # Category
         ]
         
-        for header in headers:
-            # Sort ascending
+        for header, first_click_top, second_click_top in headers:
+            # Sort one way
             header.click()
-            time.sleep(0.5)  # Wait for table to update
+            self.wait_for_table_update(driver, first_click_top)
+            table_rows = driver.find_elements(By.CSS_SELECTOR, "section > div:nth-child(n+2)")
             ascending_items = [row.text for row in table_rows]
             assert len(ascending_items) == len(expected_items)
 
-            # Sort descending
+            # Sort the other way
             header.click()
-            time.sleep(0.5)  # Wait for table to update
+            self.wait_for_table_update(driver, second_click_top)
+            table_rows = driver.find_elements(By.CSS_SELECTOR, "section > div:nth-child(n+2)")
             descending_items = [row.text for row in table_rows]
             assert len(descending_items) == len(expected_items) 
\ No newline at end of file
@@ -1,46 +1,11 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 import pytest
+from browser.routes import open_component
 
 class TestTabs:
-    @pytest.fixture
-    def driver(self):
-        # Set up Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
-        
-        # Initialize the Chrome driver with automatic driver management
-        driver = webdriver.Chrome(options=chrome_options)
-        
-        yield driver
-        
-        # Clean up
-        driver.quit()
-
     def test_tabs_initial_state(self, driver):
-        # Navigate to the page
-        driver.get("https://practiceautomatedtesting.com/webelements")
-        
-        # Click on Widgets menu
-        widgets_menu = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Widgets')]"))
-        )
-        widgets_menu.click()
-        
-        # Click on Tabs link
-        tabs_link = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Tabs')]"))
-        )
-        tabs_link.click()
-        
-        # Wait for tabs section to be visible
-        WebDriverWait(driver, 10).until(
-            EC.visibility_of_element_located((By.CSS_SELECTOR, "[class*='WebElements_tabsSection']"))
-        )
+        # Open the component (deep link, or through the sidebar menu)
+        open_component(driver, "Widgets", "Tabs", (By.CSS_SELECTOR, "[class*='WebElements_tabsSection']"))
         
         # Get all tab buttons and content panel
         tab_buttons = driver.find_elements(By.CSS_SELECTOR, "[class*='WebElements_tabButton']")
@@ -61,25 +26,8 @@ class TestTabs:
             assert 'WebElements_active' not in tab_buttons[i].get_attribute('class')
 
     def test_tab_switching(self, driver):
-        # Navigate to the page
-        driver.get("https://practiceautomatedtesting.com/webelements")
-        
-        # Click on Widgets menu
-        widgets_menu = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Widgets')]"))
-        )
-        widgets_menu.click()
-        
-        # Click on Tabs link
-        tabs_link = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Tabs')]"))
-        )
-        tabs_link.click()
-        
-        # Wait for tabs section to be visible
-        WebDriverWait(driver, 10).until(
-            EC.visibility_of_element_located((By.CSS_SELECTOR, "[class*='WebElements_tabsSection']"))
-        )
+        # Open the component (deep link, or through the sidebar menu)
+        open_component(driver, "Widgets", "Tabs", (By.CSS_SELECTOR, "[class*='WebElements_tabsSection']"))
         
         # Get all tab buttons and content panel
         tab_buttons = driver.find_elements(By.CSS_SELECTOR, "[class*='WebElements_tabButton']")
@@ -114,25 +62,8 @@ class TestTabs:
         assert 'WebElements_active' not in tab_buttons[1].get_attribute('class')
 
     def test_tab_content_verification(self, driver):
-        # Navigate to the page
-        driver.get("https://practiceautomatedtesting.com/webelements")
-        
-        # Click on Widgets menu
-        widgets_menu = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Widgets')]"))
-        )
-        widgets_menu.click()
-        
-        # Click on Tabs link
-        tabs_link = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Tabs')]"))
-        )
-        tabs_link.click()
-        
-        # Wait for tabs section to be visible
-        WebDriverWait(driver, 10).until(
-            EC.visibility_of_element_located((By.CSS_SELECTOR, "[class*='WebElements_tabsSection']"))
-        )
+        # Open the component (deep link, or through the sidebar menu)
+        open_component(driver, "Widgets", "Tabs", (By.CSS_SELECTOR, "[class*='WebElements_tabsSection']"))
         
         # Get all tab buttons and content panel
         tab_buttons = driver.find_elements(By.CSS_SELECTOR, "[class*='WebElements_tabButton']")
@@ -1,53 +1,15 @@
 import pytest
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-import time
+from browser.routes import open_component
+from browser.waits import wait_for_count
 
 class TestWebTable:
-    @pytest.fixture(scope="function")
-    def driver(self):
-        # Set up Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
-        
-        # Initialize the Chrome driver
-        driver = webdriver.Chrome(options=chrome_options)
-        yield driver
-        driver.quit()
-
     def test_verify_table_structure_and_content(self, driver):
-        # Navigate to the web elements page
-        print("Navigating to website...")
-        driver.get("https://practiceautomatedtesting.com/webelements")
-        
-        # Wait for page to load completely
-        print("Waiting for page to load...")
-        WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        # Click on Elements menu
-        print("Looking for Elements menu...")
-        elements_menu = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Elements')]"))
-        )
-        elements_menu.click()
-        
-        # Click on Web Tables link
-        print("Looking for Web Tables link...")
-        web_tables_link = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Web Tables')]"))
-        )
-        web_tables_link.click()
-        
-        # Wait for table component
-        print("Waiting for table component...")
-        table = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, '[class*="componentContainer"]'))
-        )
+        # Open the Web Tables component (deep link, or through the sidebar menu)
+        print("Opening Web Tables...")
+        open_component(driver, "Elements", "Web Tables", (By.TAG_NAME, "table"))
         
         # Get table elements
         table_element = driver.find_element(By.TAG_NAME, "table")
@@ -82,35 +44,9 @@ class TestWebTable:
         assert cells[6].is_displayed()  # Actions column
 
     def test_add_new_row_to_table(self, driver):
-        # Navigate to the web elements page
-        print("Navigating to website...")
-        driver.get("https://practiceautomatedtesting.com/webelements")
-        
-        # Wait for page to load completely
-        print("Waiting for page to load...")
-        WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        # Click on Elements menu
-        print("Looking for Elements menu...")
-        elements_menu = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Elements')]"))
-        )
-        elements_menu.click()
-        
-        # Click on Web Tables link
-        print("Looking for Web Tables link...")
-        web_tables_link = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Web Tables')]"))
-        )
-        web_tables_link.click()
-        
-        # Wait for table component
-        print("Waiting for table component...")
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, '[class*="componentContainer"]'))
-        )
+        # Open the Web Tables component (deep link, or through the sidebar menu)
+        print("Opening Web Tables...")
+        open_component(driver, "Elements", "Web Tables", (By.TAG_NAME, "table"))
         
         # Click add button
         add_button = WebDriverWait(driver, 10).until(
@@ -146,35 +82,9 @@ class TestWebTable:
         assert cells[5].text == "IT"
 
     def test_delete_row_from_table(self, driver):
-        # Navigate to the web elements page
-        print("Navigating to website...")
-        driver.get("https://practiceautomatedtesting.com/webelements")
-        
-        # Wait for page to load completely
-        print("Waiting for page to load...")
-        WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        # Click on Elements menu
-        print("Looking for Elements menu...")
-        elements_menu = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//summary[contains(., 'Elements')]"))
-        )
-        elements_menu.click()
-        
-        # Click on Web Tables link
-        print("Looking for Web Tables link...")
-        web_tables_link = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'Web Tables')]"))
-        )
-        web_tables_link.click()
-        
-        # Wait for table component
-        print("Waiting for table component...")
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, '[class*="componentContainer"]'))
-        )
+        # Open the Web Tables component (deep link, or through the sidebar menu)
+        print("Opening Web Tables...")
+        open_component(driver, "Elements", "Web Tables", (By.TAG_NAME, "table"))
         
         # Get initial row count
         initial_rows = driver.find_elements(By.CSS_SELECTOR, 'table tbody tr')
@@ -187,7 +97,7 @@ class TestWebTable:
         delete_button.click()
         
         # Wait for the row to be removed
-        time.sleep(1)  # Give time for the deletion to complete
+        wait_for_count(driver, 'table tbody tr', initial_row_count - 1)
         
         # Verify row was deleted
         new_rows = driver.find_elements(By.CSS_SELECTOR, 'table tbody tr')
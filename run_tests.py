@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
+import argparse
 import os
+import queue
 import subprocess
 import sys
 import shutil
+import threading
 from datetime import datetime
+from tools import summary_report, change_impact
 
 def run_command(command, cwd=None, env=None):
     """Run a command and return its output"""
@@ -25,14 +29,148 @@ def setup_api_env():
     """Setup API test environment"""
     api_env = os.environ.copy()
     api_env.update({
-        "API_BASE_URL": "https://api.practiceautomatedtesting.com",
+        "API_BASE_URL": os.getenv("API_BASE_URL", "https://api.practiceautomatedtesting.com"),
         "API_USERNAME": "admin",
         "API_PASSWORD": "password123"
     })
     return api_env
 
-def run_tests():
-    """Run all test suites and generate Allure report"""
+SUITES = {
+    "shopping": {
+        "title": "Selenium Tests",
+        "path": "practiceautomatedtesting/shopping/tests/",
+        "env": None,
+    },
+    "api": {
+        "title": "API Tests",
+        "path": "practiceautomatedtesting/api/tests/",
+        "env": setup_api_env,
+    },
+    "webelements": {
+        "title": "WebElements Tests",
+        "path": "practiceautomatedtesting/webelements/",
+        "env": None,
+    },
+}
+DEFAULT_SUITES = ["shopping", "api"]
+
+def suite_command(name, results_dir, tests=None, record_impact=False):
+    """
+    pytest command line for a suite, or for the given tests of it. With
+    record_impact the run also records which code its tests use, for
+    --changed. Recording profiles every call and slows the tests down, so
+    it is opt-in.
+    """
+    command = ["python3", "-m", "pytest", *(tests or [SUITES[name]["path"]]), "-v", f"--alluredir={results_dir}"]
+    if record_impact:
+        command += ["-p", "tools.change_impact", "--record-impact"]
+    return command
+
+def select_changed(suites, base):
+    """
+    {suite: node ids} of the tests affected by the changes since base;
+    suites without affected tests are left out
+    """
+    data = change_impact.refresh_static(change_impact.load_map())
+    change_impact.save_map(data)
+    selected = change_impact.select_tests(data, change_impact.changed_symbols(base))
+    if selected == change_impact.EVERYTHING:
+        print(f"Changes since {base} can affect every test")
+        return {name: None for name in suites}
+    
+    selection = {}
+    for name in suites:
+        tests = [nodeid for nodeid in selected if nodeid.startswith(SUITES[name]["path"])]
+        print(f"{SUITES[name]['title']}: {len(tests)} affected by changes since {base}")
+        if tests:
+            selection[name] = tests
+    return selection
+
+def suite_env(name):
+    """Environment for a suite, unbuffered so its output streams line by line"""
+    make_env = SUITES[name]["env"]
+    env = make_env() if make_env else os.environ.copy()
+    env["PYTHONUNBUFFERED"] = "1"
+    return env
+
+def _pump_output(name, process, lines):
+    """Forward a suite's output to the shared queue, one line at a time"""
+    for line in process.stdout:
+        lines.put((name, line.rstrip("\n")))
+    lines.put((name, None))
+
+def run_suites(suites, results_dir, jobs=1, fail_fast=True, selection=None, record_impact=False):
+    """
+    Run the suites as subprocesses, at most `jobs` at a time, printing their
+    output as it arrives with a [suite] prefix. With fail_fast the first
+    failing suite stops the others. selection optionally limits a suite to
+    some of its tests ({suite: node ids}). record_impact records the code
+    each test runs, for --changed. Returns {suite: passed}.
+    """
+    selection = selection or {}
+    pending = list(suites)
+    running = {}
+    results = {}
+    cancelled = set()
+    lines = queue.Queue()
+    width = max(len(name) for name in suites)
+    
+    def start(name):
+        print(f"\n=== Running {SUITES[name]['title']} ===")
+        process = subprocess.Popen(
+            suite_command(name, results_dir, selection.get(name), record_impact), cwd=os.getcwd(), env=suite_env(name),
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1
+        )
+        running[name] = process
+        threading.Thread(target=_pump_output, args=(name, process, lines), daemon=True).start()
+    
+    while pending or running:
+        while pending and len(running) < jobs:
+            start(pending.pop(0))
+        
+        name, line = lines.get()
+        if line is not None:
+            print(f"[{name:<{width}}] {line}", flush=True)
+            continue
+        
+        # The suite's output is closed: collect its exit status
+        passed = running.pop(name).wait() == 0
+        results[name] = passed
+        if name in cancelled:
+            print(f"{SUITES[name]['title']} cancelled")
+        elif not passed:
+            print(f"{SUITES[name]['title']} failed!")
+            if fail_fast:
+                for other, process in running.items():
+                    print(f"Cancelling {SUITES[other]['title']}")
+                    cancelled.add(other)
+                    process.terminate()
+                pending.clear()
+    
+    return results
+
+def write_summary(results_dir, timestamp):
+    """Quick local report without Allure's JVM: terminal summary plus one HTML page"""
+    summary_file = f"test-summary_{timestamp}.html"
+    print("\n=== Test Summary ===")
+    summary_report.main([results_dir, "--html", summary_file])
+    print(f"\nSummary written to {summary_file}")
+    return summary_file
+
+def run_tests(suites=DEFAULT_SUITES, jobs=1, fail_fast=True, report="allure", changed=None, record_impact=False):
+    """
+    Run the test suites and generate Allure report (or the quick summary).
+    With changed (a git revision) only the tests affected since then run;
+    record_impact refreshes the per-test map that selection uses.
+    """
+    selection = None
+    if changed:
+        selection = select_changed(suites, changed)
+        suites = [name for name in suites if name in selection]
+        if not suites:
+            print("No tests affected, nothing to run")
+            return True
+    
     # Setup allure results directory
     results_dir = setup_allure_results()
     
@@ -40,30 +178,16 @@ def run_tests():
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     report_dir = f"allure-report_{timestamp}"
     
-    # Run Selenium tests
-    print("\n=== Running Selenium Tests ===")
-    success, output = run_command(
-        ["python3", "-m", "pytest", "practiceautomatedtesting/shopping/tests/", "-v", f"--alluredir={results_dir}"],
-        cwd=os.getcwd()
-    )
-    print(output)
-    if not success:
-        print("Selenium tests failed!")
-        return False
+    results = run_suites(suites, results_dir, jobs=jobs, fail_fast=fail_fast, selection=selection,
+                         record_impact=record_impact)
+    passed = all(results.get(name, False) for name in suites)
     
-    # Setup API environment
-    api_env = setup_api_env()
+    if report == "summary":
+        # The summary is most useful when something failed, so always write it
+        write_summary(results_dir, timestamp)
+        return passed
     
-    # Run API tests
-    print("\n=== Running API Tests ===")
-    success, output = run_command(
-        ["python3", "-m", "pytest", "practiceautomatedtesting/api/tests/", "-v", f"--alluredir={results_dir}"],
-        cwd=os.getcwd(),
-        env=api_env
-    )
-    print(output)
-    if not success:
-        print("API tests failed!")
+    if not passed:
         return False
     
     # Generate Allure report
@@ -84,9 +208,39 @@ def run_tests():
     
     return True
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the test suites and generate an Allure report")
+    parser.add_argument(
+        "--suites", nargs="+", choices=sorted(SUITES), default=DEFAULT_SUITES,
+        help="Suites to run (default: %(default)s)"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1,
+        help="How many suites may run at the same time (default: 1)"
+    )
+    parser.add_argument(
+        "--fail-fast", action=argparse.BooleanOptionalAction, default=True,
+        help="Stop the remaining suites as soon as one fails (default: on)"
+    )
+    parser.add_argument(
+        "--report", choices=["allure", "summary"], default="allure",
+        help="allure: full Allure report (needs Java); summary: quick local summary (default: allure)"
+    )
+    parser.add_argument(
+        "--changed", nargs="?", const="HEAD", metavar="BASE",
+        help="Only run the tests affected by changes since BASE (default: HEAD, i.e. uncommitted changes)"
+    )
+    parser.add_argument(
+        "--record-impact", action="store_true",
+        help="Record which code each test runs, so --changed can select single tests (slows the run down)"
+    )
+    return parser.parse_args()
+
 if __name__ == "__main__":
+    args = parse_args()
     print("Starting test execution...")
-    if run_tests():
+    if run_tests(args.suites, jobs=max(1, args.jobs), fail_fast=args.fail_fast, report=args.report,
+                 changed=args.changed, record_impact=args.record_impact):
         print("\nAll tests completed successfully!")
     else:
         print("\nTest execution failed!")
@@ -0,0 +1 @@
+"""Command line tools that work across the test suites and their allure-results."""
@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+Change-based test selection.
+
+Keeps a map from every test to the repo code it depends on and, given a
+git diff, lists only the tests the change can affect.
+
+The map has two sources:
+- import tracing: each test file's imports, its conftest.py files and
+  their imports, followed transitively through the repo (file level);
+- recorded runs: with the pytest plugin enabled (-p tools.change_impact
+  --record-impact) every test records which repo functions and classes
+  ran during its setup, call and teardown - page objects, fixtures,
+  helpers. This is per test and per top-level symbol, so a change to
+  one page object method only selects the tests that used that class.
+
+Changed lines are mapped to the top-level function or class around them;
+changes outside any (imports, module constants) count as a change to the
+whole file. Files are re-parsed only when they change, recordings
+replace the entries of the tests that ran, and recorded tests that are
+no longer collected (renamed, deleted, collect_ignore'd) are dropped, so
+the map stays current incrementally. A test file with tests that were
+never recorded (e.g. a new test method) is selected as a whole whenever
+anything it imports changes.
+
+Usage:
+    python -m tools.change_impact select [--base origin/main]
+    python -m tools.change_impact refresh
+"""
+import argparse
+import ast
+import fnmatch
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+from collections import defaultdict
+
+import pytest
+from filelock import FileLock
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPACT_FILE = os.getenv('TEST_IMPACT_FILE', os.path.join(REPO_ROOT, ".test-impact.json"))
+TESTS_ROOT = "practiceautomatedtesting"
+WHOLE_FILE = "*"
+# Changes to these never affect test behaviour
+IGNORED_SUFFIXES = (".md", ".png", ".jpg")
+IGNORED_PREFIXES = ("examples/", "allure-results/", ".github/")
+EVERYTHING = "ALL"
+
+HUNK = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+
+def _rel(path):
+    return os.path.relpath(os.path.abspath(path), REPO_ROOT).replace(os.sep, "/")
+
+
+def _abs(rel_path):
+    return os.path.join(REPO_ROOT, rel_path)
+
+
+def load_map(path=IMPACT_FILE):
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = {}
+    data.setdefault("static", {})
+    data.setdefault("tests", {})
+    return data
+
+
+def save_map(data, path=IMPACT_FILE):
+    tmp_file = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_file, "w") as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+    os.replace(tmp_file, path)
+
+
+# --- import tracing -------------------------------------------------------
+
+def _import_roots(rel_path):
+    """Directories a file's imports can resolve from: its own and every parent up to the repo root"""
+    roots = []
+    directory = os.path.dirname(_abs(rel_path))
+    while True:
+        roots.append(directory)
+        if os.path.abspath(directory) == REPO_ROOT:
+            return roots
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return roots
+        directory = parent
+
+
+def _resolve_module(module, roots):
+    parts = module.split(".")
+    for root in roots:
+        base = os.path.join(root, *parts)
+        for candidate in (base + ".py", os.path.join(base, "__init__.py")):
+            if os.path.isfile(candidate):
+                return _rel(candidate)
+    return None
+
+
+def file_imports(rel_path):
+    """Repo files imported by a Python file (third-party modules are skipped)"""
+    try:
+        with open(_abs(rel_path)) as f:
+            tree = ast.parse(f.read())
+    except (OSError, SyntaxError, ValueError):
+        return []
+    roots = _import_roots(rel_path)
+    modules = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.extend((alias.name, roots) for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                package_dir = os.path.dirname(_abs(rel_path))
+                for _ in range(node.level - 1):
+                    package_dir = os.path.dirname(package_dir)
+                base_roots = [package_dir]
+            else:
+                base_roots = roots
+            if node.module:
+                modules.append((node.module, base_roots))
+            # "from package import module" imports a file too
+            prefix = f"{node.module}." if node.module else ""
+            modules.extend((prefix + alias.name, base_roots) for alias in node.names)
+    found = {_resolve_module(module, module_roots) for module, module_roots in modules}
+    found.discard(None)
+    found.discard(rel_path)
+    return sorted(found)
+
+
+def conftests_for(rel_path):
+    """conftest.py files that apply to a test file"""
+    found = []
+    for root in _import_roots(rel_path):
+        candidate = os.path.join(root, "conftest.py")
+        if os.path.isfile(candidate):
+            found.append(_rel(candidate))
+    return found
+
+
+def _ignore_patterns(rel_path):
+    """
+    Paths a conftest.py excludes through collect_ignore / collect_ignore_glob.
+    Every string literal assigned to them counts, including ones that only
+    apply under some environment (e.g. the load test), so selection never
+    names a test that the usual run would not collect.
+    """
+    try:
+        with open(_abs(rel_path)) as f:
+            tree = ast.parse(f.read())
+    except (OSError, SyntaxError, ValueError):
+        return []
+    directory = os.path.dirname(rel_path)
+    patterns = []
+    for node in ast.walk(tree):
+        if not isinstance(node, (ast.Assign, ast.AugAssign, ast.AnnAssign)):
+            continue
+        targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+        if not any(isinstance(target, ast.Name) and target.id in ("collect_ignore", "collect_ignore_glob")
+                   for target in targets):
+            continue
+        for value in ast.walk(node.value):
+            if isinstance(value, ast.Constant) and isinstance(value.value, str):
+                patterns.append(f"{directory}/{value.value}" if directory else value.value)
+    return patterns
+
+
+def find_test_files():
+    """Test files under TESTS_ROOT, without the ones a conftest.py ignores"""
+    found = []
+    patterns = []
+    for directory, _, files in os.walk(_abs(TESTS_ROOT)):
+        if "conftest.py" in files:
+            patterns.extend(_ignore_patterns(_rel(os.path.join(directory, "conftest.py"))))
+        found.extend(_rel(os.path.join(directory, name)) for name in files
+                     if name.startswith("test_") and name.endswith(".py"))
+    return sorted(rel_path for rel_path in found
+                  if not any(rel_path == pattern or rel_path.startswith(pattern.rstrip("/") + "/")
+                             or fnmatch.fnmatch(rel_path, pattern) for pattern in patterns))
+
+
+def collected_tests(rel_path):
+    """
+    Node ids (without parameters) pytest collects from a test file by its
+    default rules: test* functions, and test* methods of Test* classes
+    """
+    try:
+        with open(_abs(rel_path)) as f:
+            tree = ast.parse(f.read())
+    except (OSError, SyntaxError, ValueError):
+        return set()
+    functions = (ast.FunctionDef, ast.AsyncFunctionDef)
+    found = set()
+    for node in tree.body:
+        if isinstance(node, functions) and node.name.startswith("test"):
+            found.add(f"{rel_path}::{node.name}")
+        elif isinstance(node, ast.ClassDef) and node.name.startswith("Test"):
+            found.update(f"{rel_path}::{node.name}::{item.name}" for item in node.body
+                         if isinstance(item, functions) and item.name.startswith("test"))
+    return found
+
+
+def _unparametrized(nodeid):
+    return nodeid.split("[", 1)[0]
+
+
+def prune_recorded(data, test_files):
+    """Drop recordings of tests that are no longer collected"""
+    collected = set()
+    for test_file in test_files:
+        collected |= collected_tests(test_file)
+    data["tests"] = {nodeid: deps for nodeid, deps in data["tests"].items()
+                     if _unparametrized(nodeid) in collected}
+    return data
+
+
+def refresh_static(data):
+    """Re-parse the Python files that changed since the last refresh and prune stale recordings"""
+    static = data["static"]
+    test_files = find_test_files()
+    prune_recorded(data, test_files)
+    queue = list(test_files)
+    seen = set()
+    while queue:
+        rel_path = queue.pop()
+        if rel_path in seen:
+            continue
+        seen.add(rel_path)
+        try:
+            stat = os.stat(_abs(rel_path))
+        except OSError:
+            static.pop(rel_path, None)
+            continue
+        entry = static.get(rel_path)
+        if not entry or entry["mtime"] != stat.st_mtime or entry["size"] != stat.st_size:
+            entry = static[rel_path] = {
+                "mtime": stat.st_mtime,
+                "size": stat.st_size,
+                "imports": file_imports(rel_path),
+            }
+        queue.extend(entry["imports"])
+        if os.path.basename(rel_path).startswith("test_"):
+            queue.extend(conftests_for(rel_path))
+    for rel_path in set(static) - seen:
+        del static[rel_path]
+    return data
+
+
+def static_dependencies(data, test_file):
+    """Every repo file a test file depends on through imports and conftests"""
+    static = data["static"]
+    pending = [test_file, *conftests_for(test_file)]
+    found = set()
+    while pending:
+        rel_path = pending.pop()
+        if rel_path in found:
+            continue
+        found.add(rel_path)
+        pending.extend(static.get(rel_path, {}).get("imports", []))
+    return found
+
+
+# --- diff -------------------------------------------------------------------
+
+def top_level_symbols(rel_path):
+    """(first line, last line, name) of every top-level function and class"""
+    try:
+        with open(_abs(rel_path)) as f:
+            tree = ast.parse(f.read())
+    except (OSError, SyntaxError, ValueError):
+        return None
+    symbols = []
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            first = min([node.lineno] + [d.lineno for d in node.decorator_list])
+            symbols.append((first, node.end_lineno, node.name))
+    return symbols
+
+
+def _git(*args):
+    return subprocess.run(["git", *args], cwd=REPO_ROOT, check=True, capture_output=True, text=True).stdout
+
+
+def changed_symbols(base="HEAD"):
+    """
+    {file: set of changed top-level symbols} for the working tree against
+    base, where WHOLE_FILE stands for a change outside any function/class
+    """
+    changes = defaultdict(set)
+    current = None
+    lines = defaultdict(list)
+    for line in _git("diff", "--unified=0", "--no-renames", base).splitlines():
+        if line.startswith("+++ "):
+            current = None if line == "+++ /dev/null" else line[6:]
+        elif line.startswith("--- ") and line != "--- /dev/null":
+            # Deleted files only show up on the old side
+            changes[line[6:]]
+        elif current:
+            match = HUNK.match(line)
+            if match:
+                start, count = int(match.group(1)), int(match.group(2) or 1)
+                lines[current].extend(range(start, start + max(count, 1)))
+    for rel_path in _git("ls-files", "--others", "--exclude-standard").splitlines():
+        changes[rel_path].add(WHOLE_FILE)
+
+    for rel_path in list(changes) + list(lines):
+        if not rel_path.endswith(".py") or not os.path.exists(_abs(rel_path)):
+            changes[rel_path].add(WHOLE_FILE)
+            continue
+        symbols = top_level_symbols(rel_path)
+        if symbols is None:
+            changes[rel_path].add(WHOLE_FILE)
+            continue
+        for number in lines.get(rel_path, []):
+            names = [name for first, last, name in symbols if first <= number <= last]
+            changes[rel_path].update(names or [WHOLE_FILE])
+    return {rel_path: symbols for rel_path, symbols in changes.items() if symbols}
+
+
+# --- selection --------------------------------------------------------------
+
+def _hits(used, changed):
+    return WHOLE_FILE in used or WHOLE_FILE in changed or bool(set(used) & changed)
+
+
+def select_tests(data, changes):
+    """
+    Node ids (repo-relative) of the tests affected by changes, or EVERYTHING
+    when a change cannot be attributed (dependencies, CI or config files)
+    """
+    relevant = {}
+    for rel_path, symbols in changes.items():
+        if rel_path.endswith(IGNORED_SUFFIXES) or rel_path.startswith(IGNORED_PREFIXES):
+            continue
+        if not rel_path.endswith(".py"):
+            return EVERYTHING
+        relevant[rel_path] = symbols
+
+    recorded_by_file = defaultdict(dict)
+    for nodeid, deps in data["tests"].items():
+        recorded_by_file[nodeid.split("::", 1)[0]][nodeid] = deps
+
+    selected = []
+    for test_file in find_test_files():
+        collected = collected_tests(test_file)
+        recorded = {nodeid: deps for nodeid, deps in recorded_by_file.get(test_file, {}).items()
+                    if _unparametrized(nodeid) in collected}
+        unrecorded = collected - {_unparametrized(nodeid) for nodeid in recorded}
+        affected = relevant.keys() & static_dependencies(data, test_file)
+        if test_file in relevant and WHOLE_FILE in relevant[test_file]:
+            selected.append(test_file)
+        elif affected and (unrecorded or not recorded):
+            # Tests that were never recorded (new, renamed, or never run with
+            # --record-impact): fall back to file-level import tracing
+            selected.append(test_file)
+        elif recorded:
+            # Module-level changes (constants, imports) are never "called", so
+            # they count for every test whose file imports the changed file
+            imported = {path for path in affected if WHOLE_FILE in relevant[path]}
+            for nodeid, deps in sorted(recorded.items()):
+                if imported or any(_hits(deps[path], relevant[path]) for path in relevant if path in deps):
+                    selected.append(nodeid)
+    return selected
+
+
+# --- recording plugin -------------------------------------------------------
+
+class ImpactRecorder:
+    """Records the repo functions and classes each test runs, via sys.setprofile"""
+
+    def __init__(self):
+        self.tests = {}
+        self._current = None
+        self._code_cache = {}
+
+    def _symbol(self, code):
+        cached = self._code_cache.get(code)
+        if cached is None:
+            path = os.path.abspath(code.co_filename)
+            if (code.co_filename.startswith("<") or path == os.path.abspath(__file__)
+                    or not path.startswith(REPO_ROOT + os.sep) or "site-packages" in path):
+                cached = False
+            else:
+                name = getattr(code, "co_qualname", code.co_name).split(".")[0]
+                cached = (_rel(path), WHOLE_FILE if name.startswith("<") else name)
+            self._code_cache[code] = cached
+        return cached
+
+    def _profile(self, frame, event, arg):
+        if event == "call" and self._current is not None:
+            symbol = self._symbol(frame.f_code)
+            if symbol:
+                self._current[symbol[0]].add(symbol[1])
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item):
+        self._current = defaultdict(set)
+        sys.setprofile(self._profile)
+        threading.setprofile(self._profile)
+        try:
+            yield
+        finally:
+            sys.setprofile(None)
+            threading.setprofile(None)
+            deps = self._current
+            self._current = None
+            test_file = _rel(str(item.path))
+            deps[test_file].add(item.name.split("[")[0] if not item.cls else item.cls.__name__)
+            nodeid = f"{test_file}::{item.nodeid.split('::', 1)[1]}" if "::" in item.nodeid else test_file
+            self.tests[nodeid] = {path: sorted(symbols) for path, symbols in deps.items()}
+
+    def pytest_unconfigure(self, config):
+        if not self.tests:
+            return
+        # xdist workers and parallel suites all merge into the same file
+        with FileLock(f"{IMPACT_FILE}.lock", timeout=60):
+            data = load_map()
+            data["tests"].update(self.tests)
+            save_map(data)
+
+
+def pytest_addoption(parser):
+    parser.getgroup("impact", "test impact selection").addoption(
+        "--record-impact", action="store_true", default=False,
+        help="Record which repo code each test runs, for tools.change_impact"
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("record_impact"):
+        config.pluginmanager.register(ImpactRecorder(), "impact_recorder")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Change-based test selection")
+    commands = parser.add_subparsers(dest="command", required=True)
+    select_parser = commands.add_parser("select", help="Print the tests affected by the working tree changes")
+    select_parser.add_argument("--base", default="HEAD", help="Git revision to diff against (default: HEAD)")
+    commands.add_parser("refresh", help="Update the import map")
+    args = parser.parse_args(argv)
+
+    data = refresh_static(load_map())
+    save_map(data)
+    if args.command == "select":
+        selected = select_tests(data, changed_symbols(args.base))
+        print(EVERYTHING if selected == EVERYTHING else "\n".join(selected))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+pytest plugin: duration-aware scheduling for pytest-xdist.
+
+Records how long every test takes (setup + call + teardown) and keeps a
+moving average across runs in a JSON file. With --schedule-by-duration the
+next xdist run hands out work longest-first (LPT): each idle worker takes
+the longest remaining unit, so the workers finish at about the same time.
+
+Work units are single tests, except for files that use class-, module- or
+package-scoped fixtures (and files without recorded timings yet), which
+stay together as in --dist=loadfile.
+
+Usage (from a suite directory, with the repo root on PYTHONPATH):
+    pytest -p tools.pytest_durations -n 2 --schedule-by-duration
+"""
+import json
+import os
+from collections import defaultdict
+
+import pytest
+
+DURATIONS_FILE = ".test-durations.json"
+SMOOTHING = 0.5  # weight of the latest run in the moving average
+DEFAULT_DURATION = 1.0  # seconds, for tests that have never run
+SHARED_SCOPES = ("class", "module", "package")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("durations", "duration-aware scheduling")
+    group.addoption(
+        "--schedule-by-duration", action="store_true", default=False,
+        help="With -n: give workers the longest remaining tests first, using recorded durations"
+    )
+    group.addoption(
+        "--durations-file", default=None,
+        help=f"Where test durations are recorded (default: <rootdir>/{DURATIONS_FILE})"
+    )
+
+
+def _file_of(nodeid):
+    return nodeid.split("::", 1)[0]
+
+
+def durations_path(config):
+    return config.getoption("durations_file") or os.path.join(str(config.rootpath), DURATIONS_FILE)
+
+
+def load_durations(path):
+    """Recorded timings: {"tests": {nodeid: seconds}, "files": {...}, "grouped_files": [...]}"""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = {}
+    data.setdefault("tests", {})
+    data.setdefault("files", {})
+    data.setdefault("grouped_files", [])
+    return data
+
+
+def grouped_files(items):
+    """Files whose tests share a class-, module- or package-scoped fixture"""
+    files = set()
+    for item in items:
+        fixture_info = getattr(item, "_fixtureinfo", None)
+        if fixture_info is None:
+            continue
+        for fixture_defs in fixture_info.name2fixturedefs.values():
+            if any(fixture_def.scope in SHARED_SCOPES for fixture_def in fixture_defs):
+                files.add(_file_of(item.nodeid))
+                break
+    return sorted(files)
+
+
+class DurationRecorder:
+    """Sums the phase durations per test and merges them into the durations file"""
+
+    def __init__(self, config):
+        self.config = config
+        self.tests = defaultdict(float)
+        self.grouped_files = set()
+
+    def pytest_collection_modifyitems(self, items):
+        # Only runs where tests are collected: xdist workers or a plain run
+        self.grouped_files.update(grouped_files(items))
+
+    def pytest_sessionfinish(self, session):
+        workeroutput = getattr(session.config, "workeroutput", None)
+        if workeroutput is not None:
+            workeroutput["grouped_files"] = sorted(self.grouped_files)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        self.grouped_files.update(getattr(node, "workeroutput", {}).get("grouped_files", []))
+
+    def pytest_runtest_logreport(self, report):
+        # On the controller this sees the reports of every worker
+        if not hasattr(self.config, "workerinput"):
+            self.tests[report.nodeid] += report.duration
+
+    def pytest_unconfigure(self, config):
+        if hasattr(config, "workerinput") or not self.tests:
+            return
+        path = durations_path(config)
+        data = load_durations(path)
+        tests = data["tests"]
+        for nodeid, duration in self.tests.items():
+            previous = tests.get(nodeid)
+            tests[nodeid] = duration if previous is None else SMOOTHING * duration + (1 - SMOOTHING) * previous
+
+        files = defaultdict(float)
+        for nodeid, duration in tests.items():
+            files[_file_of(nodeid)] += duration
+        data["files"] = {name: round(duration, 3) for name, duration in sorted(files.items())}
+        data["tests"] = {nodeid: round(duration, 3) for nodeid, duration in sorted(tests.items())}
+
+        # Files collected in this run are re-evaluated, the others keep their flag
+        collected = {_file_of(nodeid) for nodeid in self.tests}
+        kept = set(data["grouped_files"]) - collected
+        data["grouped_files"] = sorted(kept | self.grouped_files)
+
+        tmp_file = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_file, path)
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(DurationRecorder(config), "duration_recorder")
+
+
+def _make_scheduler_class():
+    from xdist.scheduler import LoadScopeScheduling
+
+    class DurationScheduling(LoadScopeScheduling):
+        """
+        LoadScopeScheduling with single-test work units (file units where
+        fixtures are shared), handed out longest expected duration first
+        """
+
+        def __init__(self, config, log=None):
+            super().__init__(config, log)
+            data = load_durations(durations_path(config))
+            self.durations = data["tests"]
+            self.known_files = set(data["files"])
+            self.grouped = set(data["grouped_files"])
+            known = list(self.durations.values())
+            self.default_duration = sum(known) / len(known) if known else DEFAULT_DURATION
+            self._sorted = False
+
+        def _split_scope(self, nodeid):
+            path = _file_of(nodeid)
+            if path in self.grouped or path not in self.known_files:
+                return path
+            return nodeid
+
+        def _expected(self, work_unit):
+            return sum(self.durations.get(nodeid, self.default_duration) for nodeid in work_unit)
+
+        def _assign_work_unit(self, node):
+            # The base class fills the queue in collection order; sort it once, longest first
+            if not self._sorted:
+                self._sorted = True
+                ordered = sorted(self.workqueue.items(), key=lambda unit: -self._expected(unit[1]))
+                self.workqueue.clear()
+                self.workqueue.update(ordered)
+            super()._assign_work_unit(node)
+
+    return DurationScheduling
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if not config.getoption("schedule_by_duration"):
+        return None
+    return _make_scheduler_class()(config, log)
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Indexed store for allure-results.
+
+allure-pytest writes one JSON file per test result, container and
+attachment. This streams the result files into a single SQLite database
+so questions like "slowest 20 tests" or "all failures for the Book API
+epic" are one indexed query instead of a directory walk.
+
+Usage:
+    python -m tools.results_store ingest [allure-results]
+    python -m tools.results_store slowest --limit 20
+    python -m tools.results_store failures --epic "Book API"
+"""
+import argparse
+import json
+import os
+import sqlite3
+from datetime import datetime
+
+DEFAULT_DB = os.getenv(
+    'RESULTS_DB',
+    os.path.join(os.path.expanduser("~"), ".cache", "pythonfortesters", "results.sqlite")
+)
+DEFAULT_RESULTS_DIR = "allure-results"
+RESULT_SUFFIX = "-result.json"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    uuid TEXT PRIMARY KEY,
+    file TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    full_name TEXT,
+    history_id TEXT,
+    name TEXT,
+    status TEXT,
+    start INTEGER,
+    stop INTEGER,
+    duration_ms INTEGER,
+    epic TEXT,
+    feature TEXT,
+    story TEXT,
+    suite TEXT,
+    message TEXT
+);
+CREATE TABLE IF NOT EXISTS labels (
+    uuid TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value TEXT
+);
+CREATE INDEX IF NOT EXISTS results_full_name ON results (full_name);
+CREATE INDEX IF NOT EXISTS results_run ON results (run_id);
+CREATE INDEX IF NOT EXISTS results_status ON results (status);
+CREATE INDEX IF NOT EXISTS results_duration ON results (duration_ms);
+CREATE INDEX IF NOT EXISTS results_epic ON results (epic, status);
+CREATE INDEX IF NOT EXISTS results_file ON results (file);
+CREATE INDEX IF NOT EXISTS labels_name_value ON labels (name, value);
+CREATE INDEX IF NOT EXISTS labels_uuid ON labels (uuid);
+"""
+
+
+def connect(db_path=DEFAULT_DB):
+    """Open (and create if needed) the result store"""
+    directory = os.path.dirname(db_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _result_row(result, path, run_id):
+    labels = {}
+    for label in result.get("labels", []):
+        labels.setdefault(label.get("name"), label.get("value"))
+    start, stop = result.get("start"), result.get("stop")
+    return (
+        result["uuid"], path, run_id, result.get("fullName"), result.get("historyId"),
+        result.get("name"), result.get("status"), start, stop,
+        stop - start if start is not None and stop is not None else None,
+        labels.get("epic"), labels.get("feature"), labels.get("story"), labels.get("suite"),
+        (result.get("statusDetails") or {}).get("message")
+    )
+
+
+def ingest(conn, results_dir=DEFAULT_RESULTS_DIR, run_id=None):
+    """
+    Add the result files of results_dir that are new or changed since the
+    last ingest. Each file is parsed on its own, so memory use does not grow
+    with the size of the directory. Returns the number of results ingested.
+    """
+    run_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+    known = {row["path"]: (row["mtime"], row["size"]) for row in conn.execute("SELECT * FROM files")}
+    ingested = 0
+
+    with conn:
+        for entry in os.scandir(results_dir):
+            if not entry.name.endswith(RESULT_SUFFIX):
+                continue
+            path = os.path.abspath(entry.path)
+            stat = entry.stat()
+            if known.get(path) == (stat.st_mtime, stat.st_size):
+                continue
+            try:
+                with open(entry.path) as f:
+                    result = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Skipping {entry.name}: {e}")
+                continue
+
+            # A changed file replaces what it contributed before
+            for (uuid,) in conn.execute("SELECT uuid FROM results WHERE file = ?", (path,)).fetchall():
+                conn.execute("DELETE FROM labels WHERE uuid = ?", (uuid,))
+            conn.execute("DELETE FROM results WHERE file = ?", (path,))
+
+            conn.execute("DELETE FROM labels WHERE uuid = ?", (result["uuid"],))
+            conn.execute(f"INSERT OR REPLACE INTO results VALUES ({', '.join('?' * 15)})",
+                         _result_row(result, path, run_id))
+            conn.executemany(
+                "INSERT INTO labels VALUES (?, ?, ?)",
+                [(result["uuid"], label.get("name"), label.get("value")) for label in result.get("labels", [])]
+            )
+            conn.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?)", (path, stat.st_mtime, stat.st_size))
+            ingested += 1
+    return ingested
+
+
+def latest_run(conn):
+    """Id of the most recently ingested run, or None"""
+    row = conn.execute("SELECT run_id FROM results ORDER BY run_id DESC LIMIT 1").fetchone()
+    return row["run_id"] if row else None
+
+
+def slowest(conn, limit=20, run_id=None):
+    """The slowest tests, from one run or (by default) from every run"""
+    query = "SELECT full_name, name, status, duration_ms, run_id FROM results WHERE duration_ms IS NOT NULL"
+    params = []
+    if run_id:
+        query += " AND run_id = ?"
+        params.append(run_id)
+    query += " ORDER BY duration_ms DESC LIMIT ?"
+    return conn.execute(query, params + [limit]).fetchall()
+
+
+def failures(conn, epic=None, run_id=None):
+    """Failed and broken results, optionally for one epic and one run"""
+    query = ("SELECT full_name, name, status, epic, message, run_id FROM results "
+             "WHERE status IN ('failed', 'broken')")
+    params = []
+    if epic:
+        query += " AND epic = ?"
+        params.append(epic)
+    if run_id:
+        query += " AND run_id = ?"
+        params.append(run_id)
+    return conn.execute(query + " ORDER BY run_id DESC, full_name", params).fetchall()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Indexed store for allure-results")
+    parser.add_argument("--db", default=DEFAULT_DB, help="SQLite file (default: %(default)s)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest_parser = commands.add_parser("ingest", help="Ingest new and changed result files")
+    ingest_parser.add_argument("results_dir", nargs="?", default=DEFAULT_RESULTS_DIR)
+    ingest_parser.add_argument("--run-id", help="Run id for the ingested results (default: now)")
+
+    slowest_parser = commands.add_parser("slowest", help="List the slowest tests")
+    slowest_parser.add_argument("--limit", type=int, default=20)
+    slowest_parser.add_argument("--run-id", help="Only this run ('latest' for the most recent one)")
+
+    failures_parser = commands.add_parser("failures", help="List failed and broken tests")
+    failures_parser.add_argument("--epic")
+    failures_parser.add_argument("--run-id", help="Only this run ('latest' for the most recent one)")
+
+    args = parser.parse_args(argv)
+    conn = connect(args.db)
+    try:
+        if getattr(args, "run_id", None) == "latest" and args.command != "ingest":
+            args.run_id = latest_run(conn)
+        if args.command == "ingest":
+            count = ingest(conn, args.results_dir, args.run_id)
+            print(f"Ingested {count} results from {args.results_dir}")
+        elif args.command == "slowest":
+            for row in slowest(conn, args.limit, args.run_id):
+                print(f"{row['duration_ms']:>8} ms  {row['status']:<8} {row['full_name']}")
+        elif args.command == "failures":
+            for row in failures(conn, args.epic, args.run_id):
+                message = (row["message"] or "").splitlines()[0] if row["message"] else ""
+                print(f"{row['status']:<8} {row['full_name']}  {message[:100]}")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
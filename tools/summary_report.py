@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Fast local summary of allure-results, without Allure's JVM.
+
+Reads the *-result.json files directly and prints a terminal summary and/or
+writes one static HTML page: counts per status, durations, failure
+messages and screenshots. Meant for the local loop; CI keeps using
+`allure generate` for the full report.
+
+Usage:
+    python -m tools.summary_report [allure-results]
+    python -m tools.summary_report allure-results --html summary.html
+    python -m tools.summary_report allure-results --html summary.html --watch
+"""
+import argparse
+import html
+import json
+import os
+import time
+
+RESULT_SUFFIX = "-result.json"
+STATUSES = ("passed", "failed", "broken", "skipped", "unknown")
+FAILED = ("failed", "broken")
+
+
+class ResultsReader:
+    """
+    Parses result files once and remembers them, so reading the directory
+    again only costs the files that appeared since the last read
+    """
+
+    def __init__(self, results_dir):
+        self.results_dir = results_dir
+        self.results = {}
+
+    def refresh(self):
+        """Read new result files; returns how many were added"""
+        added = 0
+        try:
+            entries = list(os.scandir(self.results_dir))
+        except FileNotFoundError:
+            return 0
+        for entry in entries:
+            if not entry.name.endswith(RESULT_SUFFIX) or entry.name in self.results:
+                continue
+            try:
+                with open(entry.path) as f:
+                    self.results[entry.name] = summarize(json.load(f))
+            except (OSError, ValueError):
+                # Still being written; picked up on the next refresh
+                continue
+            added += 1
+        return added
+
+    def sorted_results(self):
+        return sorted(self.results.values(), key=lambda result: result["full_name"])
+
+
+def _images(item):
+    """Image attachments of a result and all of its steps"""
+    images = [a for a in item.get("attachments", []) if (a.get("type") or "").startswith("image/")]
+    for step in item.get("steps", []):
+        images.extend(_images(step))
+    return images
+
+
+def summarize(result):
+    """Keep only what the summary shows"""
+    start, stop = result.get("start"), result.get("stop")
+    details = result.get("statusDetails") or {}
+    return {
+        "name": result.get("name", ""),
+        "full_name": result.get("fullName") or result.get("name", ""),
+        "status": result.get("status", "unknown"),
+        "duration": (stop - start) / 1000 if start is not None and stop is not None else 0.0,
+        "message": details.get("message", ""),
+        "screenshots": [{"name": a.get("name", ""), "source": a["source"]} for a in _images(result)],
+    }
+
+
+def counts(results):
+    totals = dict.fromkeys(STATUSES, 0)
+    for result in results:
+        totals[result["status"] if result["status"] in totals else "unknown"] += 1
+    return totals
+
+
+def render_terminal(results, results_dir, slowest=10):
+    """Plain-text summary"""
+    totals = counts(results)
+    total_time = sum(result["duration"] for result in results)
+    lines = [
+        f"{len(results)} tests, " + ", ".join(f"{count} {status}" for status, count in totals.items() if count)
+        + f" ({total_time:.1f}s test time)"
+    ]
+
+    lines.append(f"\nSlowest {min(slowest, len(results))}:")
+    for result in sorted(results, key=lambda r: -r["duration"])[:slowest]:
+        lines.append(f"  {result['duration']:7.2f}s  {result['full_name']}")
+
+    failures = [result for result in results if result["status"] in FAILED]
+    if failures:
+        lines.append("\nFailures:")
+        for result in failures:
+            message = result["message"].splitlines()[0] if result["message"] else ""
+            lines.append(f"  {result['status'].upper():<7} {result['full_name']}")
+            if message:
+                lines.append(f"          {message[:160]}")
+            for screenshot in result["screenshots"]:
+                lines.append(f"          screenshot: {os.path.join(results_dir, screenshot['source'])}")
+    return "\n".join(lines)
+
+
+def render_html(results, results_dir, output, refresh_seconds=None):
+    """Single static page; screenshots are linked from the results directory"""
+    totals = counts(results)
+    base = os.path.relpath(results_dir, os.path.dirname(os.path.abspath(output)))
+    esc = html.escape
+    rows = []
+    for result in sorted(results, key=lambda r: (r["status"] not in FAILED, r["full_name"])):
+        details = ""
+        if result["message"]:
+            details += f"<pre>{esc(result['message'])}</pre>"
+        for screenshot in result["screenshots"]:
+            src = esc(os.path.join(base, screenshot["source"]))
+            details += f'<a href="{src}"><img src="{src}" alt="{esc(screenshot["name"])}"></a>'
+        rows.append(
+            f'<tr class="{esc(result["status"])}"><td>{esc(result["status"])}</td>'
+            f'<td>{esc(result["full_name"])}<div class="name">{esc(result["name"])}</div>{details}</td>'
+            f'<td class="num">{result["duration"]:.2f}s</td></tr>'
+        )
+    refresh = f'<meta http-equiv="refresh" content="{refresh_seconds}">' if refresh_seconds else ""
+    summary = " &middot; ".join(f'<span class="{s}">{c} {s}</span>' for s, c in totals.items() if c)
+    page = f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8">{refresh}<title>Test summary</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; width: 100%; }}
+td {{ border-bottom: 1px solid #ddd; padding: 4px 8px; vertical-align: top; }}
+.num {{ text-align: right; white-space: nowrap; }}
+.name {{ color: #666; font-size: 90%; }}
+.passed {{ color: #2e7d32; }} .failed {{ color: #c62828; }} .broken {{ color: #ef6c00; }} .skipped {{ color: #757575; }}
+tr.passed, tr.skipped {{ color: inherit; }}
+pre {{ white-space: pre-wrap; background: #f7f7f7; padding: 6px; }}
+img {{ max-width: 480px; border: 1px solid #ccc; margin: 4px 4px 0 0; }}
+</style></head><body>
+<h1>Test summary</h1>
+<p>{len(results)} tests: {summary} &middot; {sum(r["duration"] for r in results):.1f}s test time</p>
+<table>{"".join(rows)}</table>
+</body></html>
+"""
+    tmp_file = f"{output}.tmp"
+    with open(tmp_file, "w") as f:
+        f.write(page)
+    os.replace(tmp_file, output)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fast summary of allure-results")
+    parser.add_argument("results_dir", nargs="?", default="allure-results")
+    parser.add_argument("--html", help="Write a static HTML summary to this file")
+    parser.add_argument("--quiet", action="store_true", help="No terminal summary")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and update the summary as new results appear (Ctrl+C to stop)")
+    parser.add_argument("--interval", type=float, default=1.0, help="Seconds between checks in --watch mode")
+    args = parser.parse_args(argv)
+
+    reader = ResultsReader(args.results_dir)
+    reader.refresh()
+
+    def render():
+        results = reader.sorted_results()
+        if args.html:
+            render_html(results, args.results_dir, args.html, refresh_seconds=2 if args.watch else None)
+        if not args.quiet:
+            print(render_terminal(results, args.results_dir))
+
+    render()
+    if not args.watch:
+        return
+
+    try:
+        while True:
+            time.sleep(args.interval)
+            if reader.refresh():
+                if not args.quiet:
+                    print()
+                render()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()